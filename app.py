@@ -1,8 +1,33 @@
+from datetime import date
+
 import streamlit as st
-from pawpal_system import Task, Pet, Owner, Scheduler, DailyPlan, Priority
+from pawpal_system import Task, Pet, Owner, Scheduler, DailyPlan, Priority, min_to_hhmm
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
+
+@st.cache_data(ttl=600, max_entries=64)
+def compute_plan(tasks_key: tuple, avail_key: tuple, buffer_minutes: int, for_date: date) -> DailyPlan:
+    """
+    Generate the daily plan for a snapshot of tasks and availability.
+
+    Inputs are plain tuples so Streamlit can hash them; identical inputs reuse
+    the cached plan instead of rerunning the scheduler.
+
+    The plan holds Task copies rebuilt from tasks_key, not the session's Task
+    objects, so edits to st.session_state.tasks do not show up in it.
+    """
+    owner = Owner(name="", buffer_minutes=buffer_minutes)
+    for start_min, end_min in avail_key:
+        owner.set_availability_minutes(start_min, end_min)
+    tasks = [
+        Task(title=title, duration=duration, priority=Priority(priority), type=task_type,
+             is_recurring=is_recurring, due_date=due_date, frequency=frequency)
+        for title, duration, priority, task_type, is_recurring, due_date, frequency in tasks_key
+    ]
+    return Scheduler(tasks=tasks, owner_constraints=owner).generate_daily_plan(for_date)
+
+
 # Initialize session state for managing app memory (must be at top)
 if "tasks" not in st.session_state:
     st.session_state.tasks = []
@@ -53,12 +78,15 @@ At minimum, your system should:
 st.divider()
 
 st.subheader("Step 1: Create Your Pet")
-pet_name = st.text_input("Pet name", value="Mochi")
-species = st.selectbox("Species", ["Dog", "Cat", "Other"])
-breed = st.text_input("Breed (optional)", value="")
-notes = st.text_area("Notes (optional)", value="", placeholder="Any special needs or medical info")
-
-if st.button("Create Pet"):
+# Inputs are grouped in forms so typing doesn't rerun the script until submit
+with st.form("pet_form"):
+    pet_name = st.text_input("Pet name", value="Mochi")
+    species = st.selectbox("Species", ["Dog", "Cat", "Other"])
+    breed = st.text_input("Breed (optional)", value="")
+    notes = st.text_area("Notes (optional)", value="", placeholder="Any special needs or medical info")
+    create_pet = st.form_submit_button("Create Pet")
+
+if create_pet:
     st.session_state.pet = Pet(
         name=pet_name,
         species=species,
@@ -73,27 +101,32 @@ if st.session_state.pet:
 st.divider()
 
 st.subheader("Step 2: Set Owner Availability")
-owner_name = st.text_input("Owner name", value="Jordan")
-
-st.caption("Add time blocks when you're available for pet care:")
-col_time1, col_time2 = st.columns(2)
-with col_time1:
-    start_time = st.text_input("Start time (HH:MM)", value="08:00", key="start_time")
-with col_time2:
-    end_time = st.text_input("End time (HH:MM)", value="09:00", key="end_time")
-
-if st.button("Add Availability Slot"):
+with st.form("availability_form"):
+    owner_name = st.text_input("Owner name", value="Jordan")
+
+    st.caption("Add time blocks when you're available for pet care:")
+    col_time1, col_time2 = st.columns(2)
+    with col_time1:
+        start_time = st.text_input("Start time (HH:MM)", value="08:00", key="start_time")
+    with col_time2:
+        end_time = st.text_input("End time (HH:MM)", value="09:00", key="end_time")
+    add_slot = st.form_submit_button("Add Availability Slot")
+
+if add_slot:
     # Create owner if doesn't exist
     if st.session_state.owner is None:
         st.session_state.owner = Owner(name=owner_name, pet=st.session_state.pet)
 
     # Add availability slot
-    st.session_state.owner.set_availability(start_time, end_time)
-    st.success(f"✓ Added availability: {start_time} - {end_time}")
+    try:
+        st.session_state.owner.set_availability(start_time, end_time)
+        st.success(f"✓ Added availability: {start_time} - {end_time}")
+    except ValueError:
+        st.error("⚠️ Please enter times in HH:MM format (e.g., 08:00)")
 
 if st.session_state.owner:
     st.info(f"**Owner:** {st.session_state.owner.name} | **Total available:** {st.session_state.owner.total_available_minutes()} minutes")
-    if st.session_state.owner.available_hours:
+    if st.session_state.owner.available_minutes:
         st.write("**Availability windows:**")
         for start, end in st.session_state.owner.available_hours:
             st.write(f"  • {start} - {end}")
@@ -103,14 +136,6 @@ st.divider()
 st.markdown("### Step 3: Add Tasks")
 st.caption("Add pet care tasks with duration and priority.")
 
-col1, col2 = st.columns(2)
-with col1:
-    task_title = st.text_input("Task title", value="Morning walk", key="task_title")
-    duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=20, key="task_duration")
-with col2:
-    task_type = st.selectbox("Type", ["Exercise", "Feeding", "Health", "Grooming", "Fun", "Other"], key="task_type")
-    priority_str = st.selectbox("Priority", ["High", "Medium", "Low"], index=0, key="task_priority")
-
 # Map string selection to Priority enum
 priority_map = {
     "High": Priority.HIGH,
@@ -118,7 +143,17 @@ priority_map = {
     "Low": Priority.LOW
 }
 
-if st.button("Add Task"):
+with st.form("task_form"):
+    col1, col2 = st.columns(2)
+    with col1:
+        task_title = st.text_input("Task title", value="Morning walk", key="task_title")
+        duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=20, key="task_duration")
+    with col2:
+        task_type = st.selectbox("Type", ["Exercise", "Feeding", "Health", "Grooming", "Fun", "Other"], key="task_type")
+        priority_str = st.selectbox("Priority", ["High", "Medium", "Low"], index=0, key="task_priority")
+    add_task = st.form_submit_button("Add Task")
+
+if add_task:
     # Create Task object directly
     new_task = Task(
         title=task_title,
@@ -131,16 +166,23 @@ if st.button("Add Task"):
 
 if st.session_state.tasks:
     st.write("**Current tasks:**")
-    # Format Task objects for display
-    display_tasks = []
-    for task in st.session_state.tasks:
-        display_tasks.append({
-            "Title": task.title,
-            "Duration": f"{task.duration} min",
-            "Priority": task.priority.name,
-            "Type": task.type
-        })
-    st.table(display_tasks)
+    # Format Task objects for display, only when the task list has changed
+    # (tasks are only ever appended, so count + last task identify it)
+    tasks = st.session_state.tasks
+    if (st.session_state.get("task_table_len") != len(tasks)
+            or st.session_state.get("task_table_last") is not tasks[-1]):
+        st.session_state.task_table_rows = [
+            {
+                "Title": task.title,
+                "Duration": f"{task.duration} min",
+                "Priority": task.priority.name,
+                "Type": task.type
+            }
+            for task in tasks
+        ]
+        st.session_state.task_table_len = len(tasks)
+        st.session_state.task_table_last = tasks[-1]
+    st.table(st.session_state.task_table_rows)
 else:
     st.info("No tasks yet. Add one above.")
 
@@ -153,19 +195,21 @@ if st.button("Generate Schedule", type="primary"):
     # Validation checks
     if st.session_state.owner is None:
         st.error("⚠️ Please create an owner and add availability slots first!")
-    elif not st.session_state.owner.available_hours:
+    elif not st.session_state.owner.available_minutes:
         st.error("⚠️ Please add at least one availability time slot!")
     elif not st.session_state.tasks:
         st.error("⚠️ Please add at least one task!")
     else:
-        # Create scheduler with tasks and owner constraints
-        scheduler = Scheduler(
-            tasks=st.session_state.tasks,
-            owner_constraints=st.session_state.owner
+        # Generate the daily plan (cached while tasks and availability are unchanged)
+        owner = st.session_state.owner
+        tasks_key = tuple(
+            (t.title, t.duration, int(t.priority), t.type, t.is_recurring,
+             t.due_date, t.frequency)
+            for t in st.session_state.tasks
+        )
+        st.session_state.daily_plan = compute_plan(
+            tasks_key, tuple(owner.available_minutes), owner.buffer_minutes, date.today()
         )
-
-        # Generate the daily plan
-        st.session_state.daily_plan = scheduler.generate_daily_plan()
 
         st.success("✓ Schedule generated successfully!")
 
@@ -180,18 +224,21 @@ if st.session_state.daily_plan:
         st.write(f"**Date:** {plan.date}")
         st.write(f"**Tasks scheduled:** {len(plan.schedule)}")
 
-        # Display schedule in a table
-        schedule_display = []
-        for time_slot, task in sorted(plan.schedule.items()):
-            schedule_display.append({
-                "Time": time_slot,
-                "Task": task.title,
-                "Duration": f"{task.duration} min",
-                "Type": task.type,
-                "Priority": task.priority.name
-            })
-
-        st.table(schedule_display)
+        # Display schedule in a table, rebuilt only when a new plan is generated
+        if st.session_state.get("schedule_rows_plan") is not plan:
+            st.session_state.schedule_rows = [
+                {
+                    "Time": min_to_hhmm(start),
+                    "Task": task.title,
+                    "Duration": f"{task.duration} min",
+                    "Type": task.type,
+                    "Priority": task.priority.name
+                }
+                for start, _, task in plan.schedule.sorted_view()
+            ]
+            st.session_state.schedule_rows_plan = plan
+
+        st.table(st.session_state.schedule_rows)
 
         # Show reasoning
         if plan.reasoning:
@@ -4,7 +4,7 @@ Demonstrates core scheduling logic plus sorting, filtering,
 recurring tasks, and detailed conflict detection.
 """
 
-from pawpal_system import Task, Pet, Owner, Scheduler, Priority
+from pawpal_system import Task, Pet, Owner, Scheduler, Priority, min_to_hhmm
 from datetime import date
 
 
@@ -136,8 +136,8 @@ def main():
 
     print("TODAY'S SCHEDULE:")
     print("-" * 70)
-    for time_slot, task in sorted(plan.schedule.items()):
-        print(f"  {time_slot} - {task.title} ({task.duration} min) [{task.type}]")
+    for start, _, task in plan.schedule.sorted_view():
+        print(f"  {min_to_hhmm(start)} - {task.title} ({task.duration} min) [{task.type}]")
 
     print("\n" + plan.reasoning)
 
@@ -195,10 +195,8 @@ def main():
     test_plan.schedule["08:45"] = task_c  # 08:45 - 09:00 (OVERLAPS with Walk!)
 
     print("Manually created schedule with overlaps:")
-    for time_slot in sorted(test_plan.schedule.keys()):
-        task = test_plan.schedule[time_slot]
-        end_time = f"{int(time_slot.split(':')[0]) + (int(time_slot.split(':')[1]) + task.duration) // 60:02d}:{(int(time_slot.split(':')[1]) + task.duration) % 60:02d}"
-        print(f"  {time_slot}-{end_time}: {task.title} ({task.duration} min)")
+    for start, end, task in test_plan.schedule.sorted_view():
+        print(f"  {min_to_hhmm(start)}-{min_to_hhmm(end)}: {task.title} ({task.duration} min)")
 
     print("\n" + "-" * 70 + "\n")
 
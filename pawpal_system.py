@@ -4,21 +4,34 @@ Contains all core classes for pet care scheduling system.
 ──────────────────────────────────────────────────────────
 """
 
-from dataclasses import dataclass, field
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from dataclasses import InitVar, dataclass, field, replace
 from datetime import date, time, timedelta
 from enum import IntEnum
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Tuple, Optional, Iterator, Sequence, Union
 
 
+@lru_cache(maxsize=4096)
 def parse_time(t: str) -> time:
-    """Convert a time string like '08:00' or '8:00' to a datetime.time object."""
+    """
+    Convert a time string like '08:00' or '8:00' to a datetime.time object.
+
+    Memoized: the same few slot strings are parsed over and over while
+    scheduling, and time objects are immutable so sharing them is safe.
+    """
     parts = t.strip().split(":")
     return time(int(parts[0]), int(parts[1]))
 
 
 def time_to_str(t: time) -> str:
     """Convert a datetime.time object to a string like '08:00'."""
-    return f"{t.hour:02d}:{t.minute:02d}"
+    return _MIN_TO_HHMM[t.hour * 60 + t.minute]
 
 
 def add_minutes(t: time, minutes: int) -> time:
@@ -34,6 +47,185 @@ def time_to_minutes(t: time) -> int:
     return t.hour * 60 + t.minute
 
 
+@lru_cache(maxsize=1440)
+def hhmm_to_min(t: str) -> int:
+    """
+    Convert a time string like '08:00' or '8:00' to minutes since midnight.
+
+    Uses str.partition (no list allocation) and is memoized; there are only
+    1440 valid times in a day, so the cache saturates quickly.
+    """
+    if len(t) == 5 and t[2] == ":":
+        # Fast path for well-formed "HH:MM": slice instead of strip/partition
+        h, m = int(t[:2]), int(t[3:])
+    else:
+        hours, _, minutes = t.strip().partition(":")
+        h, m = int(hours), int(minutes)
+    if not (0 <= h < 24 and 0 <= m < 60):
+        raise ValueError(f"Invalid time '{t}'")
+    return h * 60 + m
+
+
+# Every "HH:MM" string of the day, interned so schedule keys and display
+# strings are shared objects instead of fresh allocations per call
+_MIN_TO_HHMM = tuple(sys.intern(f"{m // 60:02d}:{m % 60:02d}") for m in range(24 * 60))
+
+
+def min_to_hhmm(m: int) -> str:
+    """Convert minutes since midnight to a string like '08:00'."""
+    if 0 <= m < 24 * 60:
+        return _MIN_TO_HHMM[m]
+    return f"{m // 60:02d}:{m % 60:02d}"  # e.g. an end time past midnight
+
+
+def earliest_fit(free: int, duration: int, first: int, last: int) -> Optional[int]:
+    """
+    Find the earliest start in [first, last] with `duration` free minutes.
+
+    `free` is a bitmask with bit m set when minute m is free. Runs of free
+    minutes are found by ANDing the mask with shifted copies of itself,
+    doubling the run length each step, so the search costs O(log duration)
+    big-int operations instead of testing every candidate minute.
+
+    Args:
+        free: Bitmask of free minutes
+        duration: Required run length in minutes
+        first: Earliest allowed start minute
+        last: Latest allowed start minute
+
+    Returns:
+        Start minute of the first fitting run, or None if nothing fits.
+    """
+    if last < first:
+        return None
+    runs = free
+    length = 1
+    while length * 2 <= duration:
+        runs &= runs >> length
+        length *= 2
+    if length < duration:
+        runs &= runs >> (duration - length)
+    candidates = (runs >> first) & ((1 << (last - first + 1)) - 1)
+    if not candidates:
+        return None
+    return first + (candidates & -candidates).bit_length() - 1
+
+
+def wis_select(weights: List[int], preds: List[int]) -> List[int]:
+    """
+    Solve weighted interval scheduling over intervals already sorted by end time.
+
+    This is the integer-only core of Scheduler._select_pinned_tasks, kept free
+    of Task objects so it operates on two flat int sequences.
+
+    Args:
+        weights: Weight of each interval
+        preds: preds[j] = number of intervals that end at or before interval j starts
+
+    Returns:
+        Indices of the chosen intervals, in ascending order.
+    """
+    n = len(weights)
+    dp = [0] * (n + 1)
+    for j in range(n):
+        dp[j + 1] = max(dp[j], weights[j] + dp[preds[j]])
+
+    chosen = []
+    j = n
+    while j > 0:
+        if weights[j - 1] + dp[preds[j - 1]] > dp[j - 1]:
+            chosen.append(j - 1)
+            j = preds[j - 1]
+        else:
+            j -= 1
+
+    chosen.reverse()
+    return chosen
+
+
+def first_gap(blocks: List[Tuple[int, int]], busy: List[Tuple[int, int]],
+              duration: int, buffer: int, latest: int) -> Optional[int]:
+    """
+    Find the earliest start that fits a task between busy intervals.
+
+    This is the integer-only core of Scheduler._find_next_available_slot.
+    For each availability block, the already-sorted busy intervals that
+    overlap it are walked with a cursor at the latest end seen so far; the
+    first gap between the cursor and the next start that is wide enough
+    wins. A block with nothing scheduled only needs room for the task; once
+    anything is scheduled in it, gaps must also fit the buffer.
+
+    Args:
+        blocks: (start, end) availability blocks in minutes, sorted by start.
+            Blocks may overlap or touch (Owner does not merge them); each is
+            searched on its own, so a task must fit inside a single block
+        busy: (start, end) busy intervals in minutes, sorted by start
+        duration: Task length in minutes
+        buffer: Minutes to leave between tasks
+        latest: Latest allowed start minute (e.g. from energy level); any
+            earliest bound should already be applied by clipping the blocks
+
+    Returns:
+        Start minute of the first fitting gap, or None if nothing fits.
+    """
+    n = len(busy)
+    first = 0  # Busy intervals before this index ended before the current block
+
+    for block_start, block_end in blocks:
+        # Blocks are sorted, so intervals that ended before this block
+        # also end before every later one; never rescan them
+        while first < n and busy[first][1] <= block_start:
+            first += 1
+
+        cursor = block_start
+        needed = duration
+
+        for i in range(first, n):
+            busy_start, busy_end = busy[i]
+            if busy_end <= block_start:
+                continue
+            if busy_start >= block_end:
+                break  # Sorted by start: nothing later overlaps this block
+
+            needed = duration + buffer
+            if busy_start - cursor >= needed and cursor <= latest:
+                return cursor
+            if busy_end > cursor:
+                cursor = busy_end
+
+        # Gap after the last busy interval in this block
+        if block_end - cursor >= needed and cursor <= latest:
+            return cursor
+
+    return None
+
+
+def overlap_pairs(starts: Sequence[int], durations: Sequence[int]) -> List[Tuple[int, int]]:
+    """
+    Find every pair of overlapping intervals, given starts in sorted order.
+
+    This is the integer-only core of Schedule.overlaps. Each interval is
+    compared only with the intervals that start before it ends; the inner
+    scan stops at the first later start, so the cost is O(n + k) for k pairs.
+
+    Args:
+        starts: Interval start minutes, sorted ascending
+        durations: Interval lengths in minutes, aligned with starts
+
+    Returns:
+        (i, j) index pairs with i < j, in the order they are found.
+    """
+    n = len(starts)
+    pairs = []
+    for i in range(n):
+        end = starts[i] + durations[i]
+        j = i + 1
+        while j < n and starts[j] < end:
+            pairs.append((i, j))
+            j += 1
+    return pairs
+
+
 class Priority(IntEnum):
     """Priority levels for tasks."""
     HIGH = 1
@@ -41,7 +233,39 @@ class Priority(IntEnum):
     LOW = 3
 
 
-@dataclass
+class Frequency(IntEnum):
+    """Recurrence codes for tasks; DAILY and WEEKLY are the period in days."""
+    ONCE = 0
+    DAILY = 1
+    WEEKLY = 7
+    UNKNOWN = -1
+
+
+_FREQUENCIES = {"daily": Frequency.DAILY, "weekly": Frequency.WEEKLY}
+
+
+# Allowed start hours per energy level, one bit per hour of the day
+_ALL_HOURS = (1 << 24) - 1  # Medium tasks fit anytime
+_ENERGY_HOURS = {
+    "high": ((1 << 13) - 1) & ~((1 << 6) - 1),   # 06-12: morning for high-energy tasks
+    "medium": _ALL_HOURS,
+    "low": ((1 << 23) - 1) & ~((1 << 18) - 1),   # 18-22: evening for low-energy tasks
+}
+
+
+# Time windows for named preferred_time values (minutes since midnight)
+_PREF_WINDOWS = {
+    "morning": (6 * 60, 12 * 60),
+    "afternoon": (12 * 60, 17 * 60),
+    "evening": (17 * 60, 22 * 60),
+}
+
+
+# Display names by priority value; works for Priority members and plain ints
+_PRIO_NAMES = {p: p.name for p in Priority}
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a specific pet care activity.
@@ -75,6 +299,38 @@ class Task:
     energy_required: str = "medium"  # "low", "medium", "high"
     can_be_parallel: bool = False
 
+    def __post_init__(self):
+        # Categories come from a small fixed set, so share one string object each
+        if self.type:
+            self.type = sys.intern(self.type)
+
+    # Sort and filter keys, derived from the public fields on every read so
+    # that direct assignment to a field can never leave a key stale.
+
+    @property
+    def _priority_key(self) -> int:
+        """Bare int priority level, so hot sorts skip IntEnum comparison dispatch."""
+        return int(self.priority)
+
+    @property
+    def _type_key(self) -> str:
+        return sys.intern((self.type or "").lower())
+
+    @property
+    def _name_key(self) -> str:
+        return (self.title or "").lower()
+
+    @property
+    def _pet_key(self) -> str:
+        return sys.intern((self.pet_name or "").lower())
+
+    @property
+    def _frequency_key(self) -> int:
+        """Encoded frequency, so recurrence checks compare ints."""
+        if not self.frequency:
+            return Frequency.ONCE
+        return _FREQUENCIES.get(self.frequency.lower(), Frequency.UNKNOWN)
+
     def update_details(self, duration: Optional[int] = None, priority: Optional[Priority] = None) -> None:
         """
         Update the task details with optional duration and priority.
@@ -106,26 +362,13 @@ class Task:
         self.completed = True
 
         # Auto-generate next occurrence for recurring tasks
-        if self.frequency:
-            if self.frequency.lower() == "daily":
-                next_due = self.due_date + timedelta(days=1)
-            elif self.frequency.lower() == "weekly":
-                next_due = self.due_date + timedelta(weeks=1)
-            else:
-                return None  # Unknown frequency
-
-            # Create new task for next occurrence
-            return Task(
-                title=self.title,
-                duration=self.duration,
-                priority=self.priority,
-                type=self.type,
-                is_recurring=self.is_recurring,
-                completed=False,
-                pet_name=self.pet_name,
-                frequency=self.frequency,
-                due_date=next_due
-            )
+        if self._frequency_key > 0:
+            next_due = self.due_date + timedelta(days=self._frequency_key)
+
+            # Create new task for next occurrence: a copy of this one, due later.
+            # The dependency list is copied so the occurrences don't share it.
+            return replace(self, completed=False, due_date=next_due,
+                           dependencies=list(self.dependencies))
 
         return None
 
@@ -139,7 +382,16 @@ class Task:
         return f"Task({status} '{self.title}', {self.duration}min, Priority.{self.priority.name}, {self.type})"
 
 
-@dataclass
+# Sort keys for Pet.sort_tasks, read from the keys derived on each Task
+_SORT_KEYS = {
+    "priority": attrgetter("_priority_key"),
+    "duration": attrgetter("duration"),
+    "type":     attrgetter("_type_key"),
+    "name":     attrgetter("_name_key"),
+}
+
+
+@dataclass(slots=True)
 class Pet:
     """
     Represents the animal receiving care.
@@ -184,8 +436,10 @@ class Pet:
         Args:
             task: The Task object to remove
         """
-        if task in self.tasks:
+        try:
             self.tasks.remove(task)
+        except ValueError:
+            pass  # Not in the list; nothing to remove
 
     def complete_task(self, task: Task) -> None:
         """
@@ -212,27 +466,27 @@ class Pet:
 
     def sort_tasks(self, by: str = "priority", descending: bool = False) -> List[Task]:
         """Sort this pet's tasks by a given key without modifying the original list."""
-        sort_keys = {
-            "priority": lambda t: t.priority,
-            "duration": lambda t: t.duration,
-            "type":     lambda t: t.type.lower(),
-            "name":     lambda t: t.title.lower(),
-        }
-        if by not in sort_keys:
-            raise ValueError(f"Invalid sort key '{by}'. Choose from: {list(sort_keys.keys())}")
-        return sorted(self.tasks, key=sort_keys[by], reverse=descending)
+        if by not in _SORT_KEYS:
+            raise ValueError(f"Invalid sort key '{by}'. Choose from: {list(_SORT_KEYS.keys())}")
+        return sorted(self.tasks, key=_SORT_KEYS[by], reverse=descending)
 
     def filter_tasks(self, by_type: Optional[str] = None, by_priority: Optional[Priority] = None,
                      completed: Optional[bool] = None) -> List[Task]:
-        """Filter this pet's tasks by type, priority, and/or completion status."""
-        results = self.tasks
-        if by_type is not None:
-            results = [t for t in results if t.type.lower() == by_type.lower()]
-        if by_priority is not None:
-            results = [t for t in results if t.priority == by_priority]
-        if completed is not None:
-            results = [t for t in results if t.completed == completed]
-        return results
+        """
+        Filter this pet's tasks by type, priority, and/or completion status.
+
+        All criteria are applied in a single pass over the task list, comparing
+        against the lower-cased type and int priority cached on each Task.
+        Type keys are interned, so matching types compare by identity.
+        """
+        type_key = sys.intern(by_type.lower()) if by_type is not None else None
+        priority_key = int(by_priority) if by_priority is not None else None
+        return [
+            t for t in self.tasks
+            if (type_key is None or t._type_key == type_key)
+            and (priority_key is None or t._priority_key == priority_key)
+            and (completed is None or t.completed == completed)
+        ]
 
     def get_profile(self) -> str:
         """
@@ -249,23 +503,61 @@ class Pet:
         return profile
 
 
-@dataclass
+@dataclass(slots=True)
 class Owner:
     """
     Represents the user and their constraints.
 
+    Availability blocks are stored once as (start_min, end_min) integer pairs,
+    kept sorted by start; the "HH:MM" form is derived on demand. Both views
+    are read-only tuples: add slots with the set_availability methods, or
+    assign a new list to available_hours to replace them all.
+
     Attributes:
         name: The owner's name
-        available_hours: Time slots when they can do tasks
+        available_hours: Time slots when they can do tasks, as ("HH:MM", "HH:MM")
+            pairs sorted by start time (derived from available_minutes)
+        available_minutes: The same slots as (start_min, end_min) pairs
         energy_level: Optional preference for task difficulty by time
         pet: The owner's pet
         buffer_minutes: Transition time between tasks (default 5 minutes)
     """
     name: str
-    available_hours: List[Tuple[str, str]] = field(default_factory=list)
+    # Init-only; the blocks are stored in _avail_min (see the property below)
+    available_hours: InitVar[Optional[Sequence[Tuple[str, str]]]] = None
     energy_level: Optional[str] = None
     pet: Optional[Pet] = None
     buffer_minutes: int = 5
+    # Availability blocks in minutes since midnight, sorted by start
+    _avail_min: Tuple[Tuple[int, int], ...] = field(default=(), init=False, repr=False)
+    # One bit per minute of the day (bit m set = available at minute m)
+    _avail_mask: int = field(default=0, init=False, repr=False, compare=False)
+    # Popcount of _avail_mask, kept in step with it
+    _total_avail: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self, available_hours: Optional[Sequence[Tuple[str, str]]]):
+        if available_hours:
+            self.set_availability_batch(available_hours)
+
+    @property
+    def available_minutes(self) -> Tuple[Tuple[int, int], ...]:
+        """Availability blocks as (start_min, end_min) pairs, sorted by start."""
+        return self._avail_min
+
+    def _get_available_hours(self) -> Tuple[Tuple[str, str], ...]:
+        """Availability blocks as ("HH:MM", "HH:MM") pairs, sorted by start."""
+        return tuple((min_to_hhmm(start), min_to_hhmm(end)) for start, end in self._avail_min)
+
+    def _set_available_hours(self, blocks: Sequence[Tuple[str, str]]) -> None:
+        self.clear_availability()
+        self.set_availability_batch(blocks)
+
+    def __repr__(self) -> str:
+        # Written out because available_hours is not a dataclass field, so the
+        # generated repr would leave the owner's availability out
+        return (f"Owner(name={self.name!r}, available_hours={self._get_available_hours()!r}, "
+                f"energy_level={self.energy_level!r}, pet={self.pet!r}, "
+                f"buffer_minutes={self.buffer_minutes!r})")
 
     def set_availability(self, start_time: str, end_time: str) -> None:
         """
@@ -275,42 +567,108 @@ class Owner:
             start_time: Start time as string (e.g., "08:00")
             end_time: End time as string (e.g., "09:00")
         """
-        self.available_hours.append((start_time, end_time))
+        self.set_availability_minutes(hhmm_to_min(start_time), hhmm_to_min(end_time))
+
+    def set_availability_minutes(self, start_min: int, end_min: int) -> None:
+        """
+        Add a care block given directly in minutes since midnight.
+
+        Args:
+            start_min: Block start (e.g., 480 for 08:00)
+            end_min: Block end (e.g., 540 for 09:00)
+        """
+        blocks = list(self._avail_min)
+        insort(blocks, (start_min, end_min))
+        self._avail_min = tuple(blocks)
+        if end_min > start_min:
+            self._avail_mask |= ((1 << (end_min - start_min)) - 1) << start_min
+            self._total_avail = self._avail_mask.bit_count()
+
+    def set_availability_batch(self, blocks: Sequence[Tuple[str, str]]) -> None:
+        """
+        Add several care blocks at once.
+
+        Equivalent to calling set_availability for each block, but the block
+        list is re-sorted and the availability total recounted only once.
+
+        Args:
+            blocks: ("HH:MM", "HH:MM") start/end pairs, in any order
+        """
+        mask = self._avail_mask
+        merged = list(self._avail_min)
+        for start_time, end_time in blocks:
+            start_min, end_min = hhmm_to_min(start_time), hhmm_to_min(end_time)
+            merged.append((start_min, end_min))
+            if end_min > start_min:
+                mask |= ((1 << (end_min - start_min)) - 1) << start_min
+        merged.sort()
+        self._avail_min = tuple(merged)
+        self._avail_mask = mask
+        self._total_avail = mask.bit_count()
 
     def clear_availability(self) -> None:
         """Remove all existing availability slots."""
-        self.available_hours.clear()
+        self._avail_min = ()
+        self._avail_mask = 0
+        self._total_avail = 0
 
     def is_available(self, check_time: str) -> bool:
         """
         Checks if a specific time works for the owner.
 
+        Uses the precomputed availability bitmask, so each check is a single
+        shift-and-test instead of a scan over every availability block.
+
         Args:
             check_time: Time to check as string (e.g., "08:30")
 
         Returns:
             True if owner is available at that time, False otherwise
         """
-        t = parse_time(check_time)
-        for start, end in self.available_hours:
-            if parse_time(start) <= t < parse_time(end):
-                return True
-        return False
+        return bool((self._avail_mask >> hhmm_to_min(check_time)) & 1)
+
+    def fits_window(self, start_min: int, duration: int) -> bool:
+        """
+        Check whether the owner is available for every minute of a block.
+
+        Args:
+            start_min: Block start in minutes since midnight
+            duration: Block length in minutes
+
+        Returns:
+            True if all minutes in [start_min, start_min + duration) are available
+        """
+        block = ((1 << duration) - 1) << start_min
+        return block & ~self._avail_mask == 0
 
     def total_available_minutes(self) -> int:
         """
         Calculate total minutes available across all time slots.
 
+        Returns the set-bit count of the availability bitmask, refreshed
+        whenever a slot is added, so overlapping slots are not double-counted.
+
         Returns:
             Total number of available minutes
         """
-        total = 0
-        for start, end in self.available_hours:
-            s = parse_time(start)
-            e = parse_time(end)
-            diff = (e.hour * 60 + e.minute) - (s.hour * 60 + s.minute)
-            total += diff
-        return total
+        return self._total_avail
+
+    def has_window_for(self, duration: int) -> bool:
+        """
+        Check whether any run of consecutive available minutes is long enough.
+
+        Args:
+            duration: Required length in minutes
+
+        Returns:
+            True if some block of `duration` available minutes exists
+        """
+        return earliest_fit(self._avail_mask, duration, 0, 24 * 60 - duration) is not None
+
+
+# A property in the class body would be taken as the InitVar's default, so the
+# read-only available_hours view is attached once the dataclass is built
+Owner.available_hours = property(Owner._get_available_hours, Owner._set_available_hours)
 
 
 class Scheduler:
@@ -322,6 +680,7 @@ class Scheduler:
         owner_constraints: Access to the owner's time limits
         pet: The pet these tasks are for (used for context in reasoning)
     """
+    __slots__ = ("tasks", "owner_constraints", "pet")
 
     def __init__(self, tasks: List[Task], owner_constraints: Owner):
         """
@@ -335,6 +694,27 @@ class Scheduler:
         self.owner_constraints = owner_constraints
         self.pet = owner_constraints.pet
 
+    def add_task(self, task: Task) -> None:
+        """
+        Add a task to the pool scheduled by the next generate_daily_plan().
+
+        Args:
+            task: The Task object to add
+        """
+        self.tasks.append(task)
+
+    def remove_task(self, task: Task) -> None:
+        """
+        Remove a task from the scheduling pool.
+
+        Args:
+            task: The Task object to remove
+        """
+        try:
+            self.tasks.remove(task)
+        except ValueError:
+            pass  # Not in the list; nothing to remove
+
     def _topological_sort(self, tasks: List[Task]) -> List[Task]:
         """
         Sort tasks respecting dependencies using Kahn's topological sort algorithm.
@@ -344,8 +724,8 @@ class Scheduler:
         depends on the medication being administered first.
 
         Algorithm:
-            Uses Kahn's algorithm with O(V+E) time complexity where V is the number
-            of tasks and E is the number of dependencies. Maintains priority ordering
+            Uses Kahn's algorithm with O((V+E) log V) time complexity where V is the
+            number of tasks and E is the number of dependencies. Maintains priority ordering
             within each dependency level. Detects cycles and falls back gracefully.
 
         Args:
@@ -361,6 +741,11 @@ class Scheduler:
             >>> sorted_tasks = scheduler._topological_sort([task_b, task_a])
             >>> # Returns [task_a, task_b] - medication before walk
         """
+        # Fast path: with no dependencies every task is in the first level, so
+        # Kahn's algorithm reduces to ordering by (priority, title)
+        if not any(task.dependencies for task in tasks):
+            return sorted(tasks, key=attrgetter("_priority_key", "title"))
+
         # Build dependency graph
         task_map = {task.title: task for task in tasks}
         in_degree = {task.title: 0 for task in tasks}
@@ -372,20 +757,21 @@ class Scheduler:
                     adj_list[dep].append(task.title)
                     in_degree[task.title] += 1
 
-        # Kahn's algorithm for topological sort
-        queue = [title for title, degree in in_degree.items() if degree == 0]
+        # Kahn's algorithm for topological sort; the ready set is a heap keyed
+        # by (priority, title) to maintain priority ordering within same dependency level
+        heap = [(task_map[title]._priority_key, title)
+                for title, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
         sorted_titles = []
 
-        while queue:
-            # Sort queue by priority to maintain priority ordering within same dependency level
-            queue.sort(key=lambda t: (task_map[t].priority, t))
-            current = queue.pop(0)
+        while heap:
+            _, current = heapq.heappop(heap)
             sorted_titles.append(current)
 
             for neighbor in adj_list[current]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                    heapq.heappush(heap, (task_map[neighbor]._priority_key, neighbor))
 
         # Check for cycles (if sorted list is shorter, there's a cycle)
         if len(sorted_titles) != len(tasks):
@@ -429,7 +815,7 @@ class Scheduler:
             score += 1  # Same pet
         return score
 
-    def _match_energy_to_time(self, task: Task, time_slot: str) -> bool:
+    def _match_energy_to_time(self, task: Task, time_slot: Union[str, int]) -> bool:
         """
         Check if a task's energy requirements match the time of day.
 
@@ -444,7 +830,8 @@ class Scheduler:
 
         Args:
             task: Task with energy_required attribute ("high", "medium", or "low")
-            time_slot: Time string in "HH:MM" format (e.g., "08:30")
+            time_slot: Time string in "HH:MM" format (e.g., "08:30") or minutes
+                since midnight
 
         Returns:
             True if the task's energy level is appropriate for the time slot,
@@ -455,13 +842,22 @@ class Scheduler:
             >>> match = scheduler._match_energy_to_time(task, "08:00")
             >>> # Returns True (high-energy task in morning)
         """
-        hour = parse_time(time_slot).hour
+        if isinstance(time_slot, str):
+            time_slot = hhmm_to_min(time_slot)
+        hours = _ENERGY_HOURS.get(task.energy_required, _ALL_HOURS)
+        return bool((hours >> (time_slot // 60)) & 1)
 
-        if task.energy_required == "high":
-            return 6 <= hour <= 12  # Morning preference for high-energy tasks
-        elif task.energy_required == "low":
-            return 18 <= hour <= 22  # Evening preference for low-energy tasks
-        return True  # Medium tasks fit anytime
+    def _energy_window(self, task: Task) -> Tuple[int, int]:
+        """
+        Return the (earliest, latest) start minute allowed by a task's energy level.
+
+        Derived from the same hour mask as _match_energy_to_time: from the
+        first allowed hour's start through the last allowed hour's final minute.
+        """
+        hours = _ENERGY_HOURS.get(task.energy_required, _ALL_HOURS)
+        first_hour = (hours & -hours).bit_length() - 1
+        last_hour = hours.bit_length() - 1
+        return first_hour * 60, last_hour * 60 + 59
 
     def _is_due_today(self, task: Task, for_date: date) -> bool:
         """
@@ -488,20 +884,21 @@ class Scheduler:
             >>> is_due = scheduler._is_due_today(daily_task, date(2026, 2, 16))
             >>> # Returns True (daily task is due the next day)
         """
-        if not task.frequency:
+        frequency = task._frequency_key
+        if frequency == Frequency.ONCE:
             return task.due_date == for_date
 
-        if task.frequency.lower() == "daily":
+        if frequency == Frequency.DAILY:
             return task.due_date <= for_date
-        elif task.frequency.lower() == "weekly":
+        elif frequency == Frequency.WEEKLY:
             # Check if the day of week matches
             days_since_due = (for_date - task.due_date).days
             return days_since_due >= 0 and days_since_due % 7 == 0
 
         return False
 
-    def _get_busy_times_in_window(self, start_time: time, end_time: time,
-                                   plan: 'DailyPlan') -> List[Tuple[time, time]]:
+    def _get_busy_times_in_window(self, start_min: int, end_min: int,
+                                   plan: 'DailyPlan') -> List[Tuple[int, int]]:
         """
         Get all busy time slots within a given window (optimized scheduling helper).
 
@@ -509,47 +906,51 @@ class Scheduler:
         time window. Used by the optimized slot-finding algorithm to jump between
         gaps instead of checking every minute.
 
-        Performance: O(n) where n is the number of scheduled tasks.
+        Performance: O(log n + k) where n is the number of scheduled tasks and
+        k the number of candidates between the two binary-search bounds.
 
         Args:
-            start_time: Window start (datetime.time object)
-            end_time: Window end (datetime.time object)
+            start_min: Window start (minutes since midnight)
+            end_min: Window end (minutes since midnight)
             plan: Current plan with scheduled tasks
 
         Returns:
-            List of (start, end) time tuples for busy slots that overlap with the window.
-            Returns empty list if no tasks scheduled in this window.
+            List of (start, end) minute tuples for busy slots that overlap with
+            the window, in start order. Returns empty list if no tasks scheduled
+            in this window.
 
         Example:
             >>> # Owner available 08:00-12:00, tasks scheduled at 08:00-08:30 and 10:00-10:30
-            >>> busy = scheduler._get_busy_times_in_window(time(8,0), time(12,0), plan)
-            >>> # Returns [(time(8,0), time(8,30)), (time(10,0), time(10,30))]
+            >>> busy = scheduler._get_busy_times_in_window(480, 720, plan)
+            >>> # Returns [(480, 510), (600, 630)]
         """
-        busy_slots = []
-        for scheduled_start_str, scheduled_task in plan.schedule.items():
-            scheduled_start = parse_time(scheduled_start_str)
-            scheduled_end = add_minutes(scheduled_start, scheduled_task.duration)
-
-            # Check if this task overlaps with our window
-            if (time_to_minutes(scheduled_start) < time_to_minutes(end_time) and
-                time_to_minutes(scheduled_end) > time_to_minutes(start_time)):
-                busy_slots.append((scheduled_start, scheduled_end))
-
-        return busy_slots
+        return [(start, end) for start, end, _ in plan.schedule.overlapping(start_min, end_min)]
 
     def sort_by_time(self, plan: 'DailyPlan') -> List[Tuple[str, Task]]:
-        """Sort scheduled tasks by their time slot in chronological order."""
-        return sorted(plan.schedule.items(), key=lambda item: parse_time(item[0]))
+        """
+        Sort scheduled tasks by their time slot in chronological order.
+
+        The schedule already keeps its int start column sorted, so this is a
+        single ordered pass rather than a sort over "HH:MM" strings.
+        """
+        return [(min_to_hhmm(start), task) for start, _, task in plan.schedule.sorted_view()]
 
     def filter_tasks(self, completed: Optional[bool] = None,
                      pet_name: Optional[str] = None) -> List[Task]:
-        """Filter the scheduler's task pool by completion status and/or pet name."""
-        results = self.tasks
-        if completed is not None:
-            results = [t for t in results if t.completed == completed]
-        if pet_name is not None:
-            results = [t for t in results if t.pet_name.lower() == pet_name.lower()]
-        return results
+        """
+        Filter the scheduler's task pool by completion status and/or pet name.
+
+        Both criteria are applied in one pass, matching the pet name against
+        the lower-cased name cached on each Task.
+        """
+        if completed is None and pet_name is None:
+            return self.tasks
+        pet_key = pet_name.lower() if pet_name is not None else None
+        return [
+            t for t in self.tasks
+            if (completed is None or t.completed == completed)
+            and (pet_key is None or t._pet_key == pet_key)
+        ]
 
     def expand_recurring(self, for_date: Optional[date] = None) -> List[Task]:
         """
@@ -560,20 +961,20 @@ class Scheduler:
 
         Returns:
             Expanded task list with recurring tasks included appropriately
+
+        Not cached: the task list is often shared with a Pet and edited in
+        place, and this is a single linear pass over it anyway.
         """
         if for_date is None:
             for_date = date.today()
 
-        expanded = []
-        for task in self.tasks:
-            # Always include non-recurring tasks or tasks due on this date
-            if not task.is_recurring or task.due_date == for_date:
-                expanded.append(task)
-            elif task.is_recurring and self._is_due_today(task, for_date):
-                # Include recurring task if it's actually due today
-                expanded.append(task)
-
-        return expanded
+        # Always include non-recurring tasks or tasks due on this date;
+        # include other recurring tasks only if they're actually due today
+        is_due_today = self._is_due_today
+        return [
+            task for task in self.tasks
+            if not task.is_recurring or task.due_date == for_date or is_due_today(task, for_date)
+        ]
 
     def generate_daily_plan(self, for_date: Optional[date] = None) -> 'DailyPlan':
         """
@@ -584,6 +985,9 @@ class Scheduler:
         - Task dependencies: respects task ordering requirements
         - Task batching: groups similar tasks together
         - Time preferences: honors preferred time slots
+        - Exact-time requests ("HH:MM") that collide are resolved optimally
+          by weighted interval scheduling; this runs per (urgency, priority)
+          tier, so a pinned task never displaces a more important one
 
         Args:
             for_date: Date to generate plan for (defaults to today)
@@ -606,112 +1010,185 @@ class Scheduler:
         # This ensures tasks with dependencies come after their prerequisites
         all_tasks = self._topological_sort(all_tasks)
 
-        # Create a dependency order index to preserve topological ordering
-        dependency_order = {task.title: idx for idx, task in enumerate(all_tasks)}
-
         # Sort tasks with improved algorithm:
-        # 1. Preserve dependency order (from topological sort)
-        # 2. Urgent tasks (due today or overdue) first
-        # 3. High priority tasks next
-        # 4. Alphabetically for consistency
-        def sort_key(task: Task) -> tuple:
+        # 1. Urgent tasks (due today or overdue) first
+        # 2. High priority tasks next
+        # 3. Preserve dependency order (position after the topological sort)
+        # Keys are materialized once per task; the position is unique, so it
+        # also keeps equal tasks in a stable, consistent order.
+        keys = []
+        for position, task in enumerate(all_tasks):
             days_until_due = (task.due_date - for_date).days
             urgency = 0 if days_until_due <= 0 else (1 if days_until_due <= 1 else 2)
-            dep_order = dependency_order.get(task.title, 999)
-            return (urgency, task.priority, dep_order, task.title)
+            keys.append((urgency, task._priority_key, position))
 
-        sorted_tasks = sorted(all_tasks, key=sort_key)
+        order = sorted(range(len(all_tasks)), key=keys.__getitem__)
+
+        # Split the sorted tasks into (urgency, priority) tiers, placed in turn
+        tiers: List[List[Task]] = []
+        last_tier = None
+        for i in order:
+            tier = keys[i][:2]
+            if tier != last_tier:
+                tiers.append([])
+                last_tier = tier
+            tiers[-1].append(all_tasks[i])
 
         # Try to schedule each task
         scheduled = []
         skipped = []
 
-        for task in sorted_tasks:
-            # Try preferred time first if specified
-            slot = None
-            if task.preferred_time:
-                slot = self._find_slot_with_preference(task, plan, for_date)
+        # Loop-invariant lookups, bound once for the placement loops below
+        schedule = plan.schedule
+        find_preferred = self._find_slot_with_preference
+        find_next = self._find_next_available_slot
+        energy_window = self._energy_window
+        has_window_for = self.owner_constraints.has_window_for
+
+        # Gaps only shrink as the plan fills, so once a duration finds no gap
+        # in an energy window, no equal or longer task can fit there either
+        shortest_unfit: Dict[Tuple[int, int], int] = {}
+
+        for tier_tasks in tiers:
+            # Reserve the tier's best non-overlapping set of exact-time requests
+            # first; higher tiers are already placed, so they can't be displaced
+            pinned = self._select_pinned_tasks(tier_tasks, plan)
+            for start_min, task in pinned:
+                schedule.add(start_min, task)
+                scheduled.append((task, min_to_hhmm(start_min)))
+            pinned_ids = {id(task) for _, task in pinned}
+
+            for task in tier_tasks:
+                if id(task) in pinned_ids:
+                    continue
+                duration = task.duration
 
-            # Fall back to next available slot if preferred time doesn't work
-            if not slot:
-                slot = self._find_next_available_slot(task, plan)
+                # No availability block is long enough, so no search can succeed
+                if not has_window_for(duration):
+                    skipped.append(task)
+                    continue
 
-            if slot:
-                plan.schedule[slot] = task
-                scheduled.append((task, slot))
-            else:
-                skipped.append(task)
+                # Try preferred time first if specified
+                slot = None
+                if task.preferred_time:
+                    slot = find_preferred(task, plan, for_date)
+
+                # Fall back to next available slot if preferred time doesn't work
+                if not slot:
+                    window = energy_window(task)
+                    if duration < shortest_unfit.get(window, duration + 1):
+                        slot = find_next(task, plan)
+                        if not slot:
+                            shortest_unfit[window] = duration
+
+                if slot:
+                    schedule[slot] = task
+                    scheduled.append((task, slot))
+                else:
+                    skipped.append(task)
 
         # Generate reasoning
         plan.reasoning = self._generate_reasoning(scheduled, skipped)
 
         return plan
 
-    def _find_next_available_slot(self, task: Task, plan: 'DailyPlan') -> Optional[str]:
+    def _select_pinned_tasks(self, tasks: List[Task],
+                             plan: Optional['DailyPlan'] = None) -> List[Tuple[int, Task]]:
+        """
+        Choose which exact-time ("HH:MM") requests to honor using weighted interval scheduling.
+
+        When several tasks ask for specific times that overlap, a greedy pass in
+        priority order can lock in a task that blocks a more valuable set. This
+        method solves the classic weighted interval scheduling problem over the
+        pinned requests that fit inside the owner's availability, so the chosen
+        set has the maximum total weight.
+
+        Algorithm:
+            1. Build one interval per pinned task, weighted by priority first and
+               duration second: (4 - priority) * 1000 + duration
+            2. Sort intervals by end time
+            3. p(j) = number of intervals ending at or before interval j starts
+               (binary search on the sorted end times)
+            4. dp[j] = max(dp[j-1], w[j] + dp[p(j)])
+            5. Walk the table backwards to recover the chosen intervals
+
+        Time Complexity: O(n log n) where n is the number of pinned tasks
+
+        Args:
+            tasks: Candidate tasks; only those with an "HH:MM" preferred_time are considered
+            plan: Plan holding tasks placed earlier; requests that conflict
+                with them are not candidates
+
+        Returns:
+            List of (start_min, task) for the requests to reserve, in chronological order.
+        """
+        intervals = []
+        for task in tasks:
+            if not task.preferred_time or ":" not in task.preferred_time:
+                continue
+            try:
+                start = hhmm_to_min(task.preferred_time)
+            except ValueError:
+                continue  # Invalid time format, fall back to regular scheduling
+            end = start + task.duration
+            if (self.owner_constraints.fits_window(start, task.duration) and
+                    (plan is None or not self._slot_conflicts(start, end, plan, task))):
+                weight = (4 - task._priority_key) * 1000 + task.duration
+                intervals.append((end, start, weight, task))
+
+        if not intervals:
+            return []
+
+        intervals.sort(key=lambda iv: (iv[0], iv[1]))
+        ends = [iv[0] for iv in intervals]
+        preds = [bisect_right(ends, iv[1], 0, j) for j, iv in enumerate(intervals)]
+        chosen = wis_select([iv[2] for iv in intervals], preds)
+        return [(intervals[j][1], intervals[j][3]) for j in chosen]
+
+    def _find_next_available_slot(self, task: Task, plan: 'DailyPlan',
+                                  not_before: int = 0) -> Optional[str]:
         """
         Find the next available time slot that fits the task (optimized version).
 
         Improvements:
-        - Jumps between scheduled tasks instead of checking every minute
+        - Sweeps the gaps between scheduled tasks instead of checking every minute
         - Adds buffer time between tasks
         - Supports parallel tasks
 
+        Algorithm:
+            For each availability block, walk the already-sorted scheduled
+            intervals that overlap it, keeping a cursor at the latest end seen
+            so far. The first gap between the cursor and the next start that
+            fits the task (plus buffer) is returned. The sweep itself runs in
+            first_gap() on plain ints and costs O(blocks + scheduled).
+
         Args:
             task: The task to schedule
             plan: Current plan with already scheduled tasks
+            not_before: Earliest allowed start in minutes since midnight
+                (e.g. the current time when rescheduling)
 
         Returns:
             Start time as string (e.g., "08:00") or None if no slot found
         """
-        task_duration_with_buffer = task.duration + self.owner_constraints.buffer_minutes
-
-        for start_str, end_str in self.owner_constraints.available_hours:
-            start_time = parse_time(start_str)
-            end_time = parse_time(end_str)
-
-            # Get all busy slots in this window
-            busy_slots = self._get_busy_times_in_window(start_time, end_time, plan)
-
-            # Sort busy slots by start time
-            busy_slots.sort(key=lambda slot: time_to_minutes(slot[0]))
-
-            # Try to fit in the gap before the first busy slot
-            if not busy_slots:
-                # No tasks scheduled in this window - use the start
-                if time_to_minutes(start_time) + task.duration <= time_to_minutes(end_time):
-                    if self._match_energy_to_time(task, time_to_str(start_time)):
-                        return time_to_str(start_time)
-            else:
-                # Check gap before first task
-                first_busy_start = busy_slots[0][0]
-                gap_minutes = time_to_minutes(first_busy_start) - time_to_minutes(start_time)
-                if gap_minutes >= task_duration_with_buffer:
-                    if self._match_energy_to_time(task, time_to_str(start_time)):
-                        return time_to_str(start_time)
-
-                # Check gaps between busy slots
-                for i in range(len(busy_slots) - 1):
-                    current_end = busy_slots[i][1]
-                    next_start = busy_slots[i + 1][0]
-
-                    gap_minutes = time_to_minutes(next_start) - time_to_minutes(current_end)
-                    if gap_minutes >= task_duration_with_buffer:
-                        potential_start = time_to_str(current_end)
-                        task_end = add_minutes(current_end, task.duration)
-
-                        if not self._slot_conflicts(current_end, task_end, plan, task):
-                            if self._match_energy_to_time(task, potential_start):
-                                return potential_start
-
-                # Check gap after last busy slot
-                last_busy_end = busy_slots[-1][1]
-                remaining_minutes = time_to_minutes(end_time) - time_to_minutes(last_busy_end)
-                if remaining_minutes >= task_duration_with_buffer:
-                    potential_start = time_to_str(last_busy_end)
-                    if self._match_energy_to_time(task, potential_start):
-                        return potential_start
+        # Restrict availability to the task's energy window (and not_before)
+        # up front: blocks entirely outside it are dropped and the rest start
+        # no earlier than it
+        earliest, latest = self._energy_window(task)
+        earliest = max(earliest, not_before)
+        blocks = [
+            (max(start, earliest), end)
+            for start, end in self.owner_constraints.available_minutes
+            if end > earliest and start <= latest
+        ]
+        if not blocks:
+            return None
 
-        return None
+        # Only intervals touching the availability span matter to the sweep
+        busy = self._get_busy_times_in_window(blocks[0][0], max(end for _, end in blocks), plan)
+        start = first_gap(blocks, busy, task.duration,
+                          self.owner_constraints.buffer_minutes, latest)
+        return None if start is None else min_to_hhmm(start)
 
     def _find_slot_with_preference(self, task: Task, plan: 'DailyPlan',
                                     for_date: date) -> Optional[str]:
@@ -751,60 +1228,43 @@ class Scheduler:
             return None
 
         pref = task.preferred_time.lower()
+        window = _PREF_WINDOWS.get(pref)
 
-        # Define time windows for named preferences
-        time_windows = {
-            "morning": ("06:00", "12:00"),
-            "afternoon": ("12:00", "17:00"),
-            "evening": ("17:00", "22:00")
-        }
+        if window is not None:
+            pref_start, pref_end = window
 
-        if pref in time_windows:
-            pref_start, pref_end = time_windows[pref]
-            pref_start_time = parse_time(pref_start)
-            pref_end_time = parse_time(pref_end)
+            # The plan's occupancy profile (one bit per busy minute) is the same
+            # for every block, so build the free mask once per task
+            free = ~plan.schedule.busy_mask(task.can_be_parallel)
+            task_with_buffer = task.duration + self.owner_constraints.buffer_minutes
 
             # Find owner availability that overlaps with preference
-            for avail_start_str, avail_end_str in self.owner_constraints.available_hours:
-                avail_start = parse_time(avail_start_str)
-                avail_end = parse_time(avail_end_str)
+            for avail_start, avail_end in self.owner_constraints.available_minutes:
+                if avail_start >= pref_end:
+                    break  # Blocks are sorted by start: none later can overlap
 
                 # Calculate overlap between availability and preference
-                overlap_start = max(time_to_minutes(avail_start), time_to_minutes(pref_start_time))
-                overlap_end = min(time_to_minutes(avail_end), time_to_minutes(pref_end_time))
+                overlap_start = max(avail_start, pref_start)
+                overlap_end = min(avail_end, pref_end)
 
                 if overlap_end - overlap_start >= task.duration:
-                    # Try to schedule in this overlapping window
-                    window_start = time(overlap_start // 60, overlap_start % 60)
-                    window_end = time(overlap_end // 60, overlap_end % 60)
-
-                    # Create a temporary mini-plan for just this window
-                    current = window_start
-                    task_with_buffer = task.duration + self.owner_constraints.buffer_minutes
-
-                    while time_to_minutes(current) + task_with_buffer <= time_to_minutes(window_end):
-                        task_end = add_minutes(current, task.duration)
-
-                        if not self._slot_conflicts(current, task_end, plan, task):
-                            return time_to_str(current)
-
-                        current = add_minutes(current, 1)
+                    # Take the earliest start in this overlapping window
+                    start = earliest_fit(free, task.duration, overlap_start,
+                                         overlap_end - task_with_buffer)
+                    if start is not None:
+                        return min_to_hhmm(start)
 
         elif ":" in pref:
             # Specific time like "08:00"
             try:
-                specific_time = parse_time(pref)
-                task_end = add_minutes(specific_time, task.duration)
+                specific_start = hhmm_to_min(pref)
+                task_end = specific_start + task.duration
 
                 # Check if this time is within owner availability
-                for avail_start_str, avail_end_str in self.owner_constraints.available_hours:
-                    avail_start = parse_time(avail_start_str)
-                    avail_end = parse_time(avail_end_str)
-
-                    if (time_to_minutes(avail_start) <= time_to_minutes(specific_time) and
-                        time_to_minutes(task_end) <= time_to_minutes(avail_end)):
+                for avail_start, avail_end in self.owner_constraints.available_minutes:
+                    if avail_start <= specific_start and task_end <= avail_end:
 
-                        if not self._slot_conflicts(specific_time, task_end, plan, task):
+                        if not self._slot_conflicts(specific_start, task_end, plan, task):
                             return pref
 
             except (ValueError, AttributeError):
@@ -812,7 +1272,7 @@ class Scheduler:
 
         return None
 
-    def _slot_conflicts(self, start: time, end: time, plan: 'DailyPlan',
+    def _slot_conflicts(self, start_min: int, end_min: int, plan: 'DailyPlan',
                         current_task: Optional[Task] = None) -> bool:
         """
         Check if a proposed time slot conflicts with any scheduled tasks.
@@ -821,32 +1281,27 @@ class Scheduler:
         - Supports parallel tasks (tasks marked can_be_parallel can overlap)
 
         Args:
-            start: Proposed start time
-            end: Proposed end time
+            start_min: Proposed start (minutes since midnight)
+            end_min: Proposed end (minutes since midnight)
             plan: Current plan with scheduled tasks
             current_task: The task being scheduled (for parallel task checking)
 
         Returns:
             True if there's a conflict, False otherwise
         """
-        start_min = time_to_minutes(start)
-        end_min = time_to_minutes(end)
+        schedule = plan.schedule
+        if not schedule:
+            return False  # Nothing scheduled yet, so nothing to conflict with
 
-        for scheduled_start_str, scheduled_task in plan.schedule.items():
-            scheduled_start = parse_time(scheduled_start_str)
-            scheduled_end = add_minutes(scheduled_start, scheduled_task.duration)
+        parallel_ok = current_task is not None and current_task.can_be_parallel
 
-            scheduled_start_min = time_to_minutes(scheduled_start)
-            scheduled_end_min = time_to_minutes(scheduled_end)
+        # Only entries that actually overlap the slot are visited (binary search)
+        for _, _, scheduled_task in schedule.overlapping(start_min, end_min):
+            # There's an overlap - check if both tasks allow parallelization
+            if parallel_ok and scheduled_task.can_be_parallel:
+                continue  # Allow overlap for parallel tasks
 
-            # Check for overlap: tasks overlap if one starts before the other ends
-            if not (end_min <= scheduled_start_min or start_min >= scheduled_end_min):
-                # There's an overlap - check if both tasks allow parallelization
-                if (current_task and current_task.can_be_parallel and
-                    scheduled_task.can_be_parallel):
-                    continue  # Allow overlap for parallel tasks
-
-                return True  # Conflict detected
+            return True  # Conflict detected
 
         return False
 
@@ -861,21 +1316,21 @@ class Scheduler:
         Returns:
             Explanation string
         """
-        lines = []
-        lines.append("Scheduling Reasoning:")
-        lines.append("-" * 40)
+        lines = ["Scheduling Reasoning:", "-" * 40]
 
         if scheduled:
             lines.append(f"✓ Scheduled {len(scheduled)} task(s) by priority:")
-            for task, slot in scheduled:
-                priority_name = Priority(task.priority).name
-                lines.append(f"  • {slot} - {task.title} ({priority_name} priority)")
+            lines.extend(
+                f"  • {slot} - {task.title} ({_PRIO_NAMES[task.priority]} priority)"
+                for task, slot in scheduled
+            )
 
         if skipped:
             lines.append(f"\n⚠ Could not fit {len(skipped)} task(s):")
-            for task in skipped:
-                priority_name = Priority(task.priority).name
-                lines.append(f"  • {task.title} ({task.duration}min, {priority_name} priority)")
+            lines.extend(
+                f"  • {task.title} ({task.duration}min, {_PRIO_NAMES[task.priority]} priority)"
+                for task in skipped
+            )
             lines.append("\nReason: Insufficient available time slots or conflicts.")
 
         total_available = self.owner_constraints.total_available_minutes()
@@ -889,18 +1344,18 @@ class Scheduler:
         Lightweight conflict detection returning user-friendly warning messages.
 
         This method is designed for production use - it never raises exceptions and
-        always returns actionable information. All operations are wrapped in try-except
-        blocks to handle edge cases gracefully.
+        always returns actionable information. Start times and durations are
+        validated once when entries are added to the schedule, so the scan itself
+        is plain integer arithmetic with no per-pair error handling.
 
         Safety Features:
             - Returns empty list for empty schedules (fast path)
-            - Handles invalid time formats without crashing
-            - Uses getattr() to safely access pet_name
-            - Continues checking other tasks if one fails
+            - Time slots are validated when added to the schedule, so the scan never sees bad times
+            - Missing pet names are reported as "Unknown"
 
         Algorithm:
-            1. Convert all scheduled tasks to time ranges
-            2. Check each pair for overlap using interval arithmetic
+            1. Take the overlapping pairs from the plan's cached sweep (Schedule.overlaps)
+            2. Compare each task only with tasks that start before it ends
             3. Calculate exact overlap duration in minutes
             4. Categorize conflicts (same pet vs different pets)
             5. Format as emoji-prefixed warning messages
@@ -917,64 +1372,11 @@ class Scheduler:
             ... else:
             ...     print("✅ Schedule is clean!")
         """
-        warnings = []
-
         # Quick validation - empty schedule is safe
         if not plan.schedule:
-            return warnings
-
-        # Convert to time ranges
-        time_ranges = []
-        for start_str, task in plan.schedule.items():
-            try:
-                start = parse_time(start_str)
-                end = add_minutes(start, task.duration)
-                time_ranges.append((start_str, time_to_str(end), task))
-            except (ValueError, AttributeError):
-                # Gracefully handle invalid time formats
-                warnings.append(f"⚠️  Warning: Invalid time format for task '{task.title}'")
-                continue
-
-        # Check pairs for overlaps
-        for i in range(len(time_ranges)):
-            for j in range(i + 1, len(time_ranges)):
-                start1, end1, task1 = time_ranges[i]
-                start2, end2, task2 = time_ranges[j]
-
-                try:
-                    s1 = time_to_minutes(parse_time(start1))
-                    e1 = time_to_minutes(parse_time(end1))
-                    s2 = time_to_minutes(parse_time(start2))
-                    e2 = time_to_minutes(parse_time(end2))
-
-                    # Check for overlap
-                    if not (e1 <= s2 or s1 >= e2):
-                        overlap_min = min(e1, e2) - max(s1, s2)
-
-                        # Get pet names safely
-                        pet1 = getattr(task1, 'pet_name', 'Unknown') or 'Unknown'
-                        pet2 = getattr(task2, 'pet_name', 'Unknown') or 'Unknown'
-
-                        if pet1.lower() == pet2.lower():
-                            warnings.append(
-                                f"⚠️  {pet1}: '{task1.title}' at {start1} conflicts with "
-                                f"'{task2.title}' at {start2} ({overlap_min} min overlap)"
-                            )
-                        else:
-                            warnings.append(
-                                f"⚠️  Multi-pet conflict: {pet1}'s '{task1.title}' at {start1} "
-                                f"overlaps with {pet2}'s '{task2.title}' at {start2} "
-                                f"({overlap_min} min overlap)"
-                            )
-                except (ValueError, AttributeError, TypeError):
-                    # Gracefully handle any calculation errors
-                    warnings.append(
-                        f"⚠️  Warning: Could not validate timing for '{task1.title}' "
-                        f"and '{task2.title}'"
-                    )
-                    continue
+            return []
 
-        return warnings
+        return [_format_conflict_warning(rec) for rec in _scan_conflicts(plan.schedule)]
 
     def check_conflicts(self, plan: 'DailyPlan') -> List[Tuple[str, str, str]]:
         """
@@ -988,39 +1390,8 @@ class Scheduler:
             List of (task1_title, task2_title, description) tuples.
             Empty list means no conflicts.
         """
-        conflicts = []
-        time_ranges = []
-        for start_str, task in plan.schedule.items():
-            start = parse_time(start_str)
-            end = add_minutes(start, task.duration)
-            time_ranges.append((start_str, time_to_str(end), task))
-
-        for i in range(len(time_ranges)):
-            for j in range(i + 1, len(time_ranges)):
-                start1, end1, task1 = time_ranges[i]
-                start2, end2, task2 = time_ranges[j]
-                s1, e1 = time_to_minutes(parse_time(start1)), time_to_minutes(parse_time(end1))
-                s2, e2 = time_to_minutes(parse_time(start2)), time_to_minutes(parse_time(end2))
-
-                if not (e1 <= s2 or s1 >= e2):
-                    overlap_start = max(s1, s2)
-                    overlap_end = min(e1, e2)
-                    overlap_min = overlap_end - overlap_start
-
-                    # Determine conflict type: same pet or different pets
-                    pet1 = task1.pet_name if task1.pet_name else "Unknown"
-                    pet2 = task2.pet_name if task2.pet_name else "Unknown"
-
-                    if pet1.lower() == pet2.lower():
-                        conflict_type = f"SAME PET ({pet1})"
-                    else:
-                        conflict_type = f"DIFFERENT PETS ({pet1} vs {pet2})"
-
-                    desc = (f"[{conflict_type}] '{task1.title}' ({start1}-{end1}) overlaps with "
-                            f"'{task2.title}' ({start2}-{end2}) by {overlap_min} min")
-                    conflicts.append((task1.title, task2.title, desc))
-
-        return conflicts
+        return [(rec[2].title, rec[5].title, _format_conflict_detail(rec))
+                for rec in _scan_conflicts(plan.schedule)]
 
     def explain_reasoning(self, plan: 'DailyPlan') -> str:
         """
@@ -1037,22 +1408,17 @@ class Scheduler:
             return plan.reasoning
 
         # Generate summary if reasoning is missing
-        lines = []
-        lines.append("Plan Summary:")
-        lines.append("-" * 40)
+        lines = ["Plan Summary:", "-" * 40]
 
         if not plan.schedule:
             lines.append("No tasks were scheduled.")
         else:
             lines.append(f"Scheduled {len(plan.schedule)} task(s):")
-            for start_str, task in sorted(plan.schedule.items()):
-                end_time = add_minutes(parse_time(start_str), task.duration)
-                end_str = time_to_str(end_time)
-                priority_name = Priority(task.priority).name
-                lines.append(
-                    f"  • {start_str}-{end_str}: {task.title} "
-                    f"({task.duration}min, {priority_name} priority)"
-                )
+            lines.extend(
+                f"  • {min_to_hhmm(start_min)}-{min_to_hhmm(end_min)}: {task.title} "
+                f"({task.duration}min, {_PRIO_NAMES[task.priority]} priority)"
+                for start_min, end_min, task in plan.schedule.sorted_view()
+            )
 
         if self.pet:
             lines.append(f"\nPet: {self.pet.name} ({self.pet.species})")
@@ -1071,9 +1437,9 @@ class Scheduler:
         Algorithm:
             1. Locate task in current schedule (by title or time slot)
             2. Remove task from its current position
-            3. Calculate remaining available time windows
-            4. Attempt to find new slot using standard slot-finding
-            5. If successful, update schedule; otherwise restore original slot
+            3. Attempt to find new slot using standard slot-finding, starting
+               no earlier than from_time (owner availability is not modified)
+            4. If successful, update schedule; otherwise restore original slot
 
         Use Cases:
             - Missed task needs to be rescheduled later
@@ -1102,51 +1468,30 @@ class Scheduler:
         """
         # Find the task in the schedule
         task_to_reschedule = None
-        original_slot = from_time
+        original_start = None  # Minutes since midnight
 
         if from_time and from_time in plan.schedule:
             if plan.schedule[from_time].title == task_title:
                 task_to_reschedule = plan.schedule[from_time]
+                original_start = hhmm_to_min(from_time)
         else:
             # Search for task by title
-            for slot, task in plan.schedule.items():
+            for start, _, task in plan.schedule.sorted_view():
                 if task.title == task_title:
                     task_to_reschedule = task
-                    original_slot = slot
+                    original_start = start
                     break
 
-        if not task_to_reschedule or not original_slot:
+        if task_to_reschedule is None or original_start is None:
             return None  # Task not found
 
         # Remove task from current slot
-        del plan.schedule[original_slot]
-
-        # Find remaining available time (after current time if specified)
-        remaining_blocks = []
-        if from_time:
-            cutoff_time = parse_time(from_time)
-            for start_str, end_str in self.owner_constraints.available_hours:
-                start = parse_time(start_str)
-                end = parse_time(end_str)
-
-                # Only consider blocks that are after the cutoff time
-                if time_to_minutes(end) > time_to_minutes(cutoff_time):
-                    # Adjust start time if block starts before cutoff
-                    if time_to_minutes(start) < time_to_minutes(cutoff_time):
-                        start = cutoff_time
-                    remaining_blocks.append((time_to_str(start), time_to_str(end)))
-        else:
-            remaining_blocks = self.owner_constraints.available_hours
-
-        # Temporarily update owner constraints to use only remaining blocks
-        original_blocks = self.owner_constraints.available_hours
-        self.owner_constraints.available_hours = remaining_blocks
+        del plan.schedule[original_start]
 
-        # Try to find a new slot
-        new_slot = self._find_next_available_slot(task_to_reschedule, plan)
-
-        # Restore original availability
-        self.owner_constraints.available_hours = original_blocks
+        # Only look at time after the cutoff, if one was given; the owner's
+        # availability itself is left untouched
+        cutoff = hhmm_to_min(from_time) if from_time else 0
+        new_slot = self._find_next_available_slot(task_to_reschedule, plan, not_before=cutoff)
 
         if new_slot:
             # Schedule in new slot
@@ -1154,24 +1499,316 @@ class Scheduler:
             return new_slot
         else:
             # Couldn't reschedule, put back in original slot
-            plan.schedule[original_slot] = task_to_reschedule
+            plan.schedule.add(original_start, task_to_reschedule)
             return None
 
 
-@dataclass
+class Schedule(MutableMapping):
+    """
+    A mapping of "HH:MM" time slot to Task, stored as a Structure-of-Arrays.
+
+    Start times and durations are kept as parallel int16 columns of minutes
+    since midnight, sorted by start time, next to a list of Task references.
+    Time strings are parsed once on insert and formatted only when iterated,
+    so sorting and conflict checks work on plain integers.
+
+    Keys may be given either as "HH:MM" strings or as int minutes.
+
+    Tasks stay mutable once scheduled (e.g. Task.update_details), so every
+    read first checks the columns against the tasks' live duration and
+    can_be_parallel values and rebuilds them, dropping the caches, if any
+    have changed.
+
+    Example:
+        >>> schedule = Schedule()
+        >>> schedule["08:30"] = walk
+        >>> schedule.add(7 * 60, feeding)
+        >>> list(schedule)
+        ['07:00', '08:30']
+    """
+    __slots__ = ("_starts_min", "_durs_min", "_parallel", "_tasks", "_max_dur",
+                 "_masks", "_overlaps")
+
+    def __init__(self, entries: Optional[Dict[Union[str, int], Task]] = None):
+        self._starts_min = array("h")
+        self._durs_min = array("h")
+        # can_be_parallel of each task as of the last sync, aligned with _tasks
+        self._parallel: List[bool] = []
+        self._tasks: List[Task] = []
+        # Longest duration ever added; bounds how far back overlapping() looks
+        self._max_dur = 0
+        # Cached (all tasks, non-parallel tasks) occupancy bitmasks
+        self._masks: Optional[Tuple[int, int]] = None
+        # Cached result of overlaps(), shared by every conflict check
+        self._overlaps: Optional[List[Tuple[int, int, Task, int, int, Task]]] = None
+        if entries:
+            for key, task in entries.items():
+                self[key] = task
+
+    @staticmethod
+    def _to_min(key: Union[str, int]) -> int:
+        """Normalize a time-slot key to minutes since midnight."""
+        if isinstance(key, int):
+            return key
+        if isinstance(key, str):
+            return hhmm_to_min(key)
+        raise KeyError(key)
+
+    def _index(self, start_min: int) -> int:
+        """Return the position of start_min, or -1 if it isn't scheduled."""
+        i = bisect_left(self._starts_min, start_min)
+        if i < len(self._starts_min) and self._starts_min[i] == start_min:
+            return i
+        return -1
+
+    def _sync(self) -> None:
+        """Rebuild the duration/parallel columns if any scheduled task changed."""
+        tasks = self._tasks
+        durs = array("h", [task.duration for task in tasks])
+        parallel = [task.can_be_parallel for task in tasks]
+        if durs != self._durs_min or parallel != self._parallel:
+            self._durs_min = durs
+            self._parallel = parallel
+            self._max_dur = max(self._max_dur, max(durs, default=0))
+            self._masks = None
+            self._overlaps = None
+
+    def add(self, start_min: int, task: Task) -> None:
+        """
+        Schedule a task at a start time given in minutes since midnight.
+
+        Replaces any task already scheduled at that exact start time. Start and
+        duration are validated here, so every later scan can use them as-is.
+
+        Raises:
+            ValueError: If the start is outside the day or the duration is negative
+        """
+        if not 0 <= start_min < 24 * 60:
+            raise ValueError(f"Start minute {start_min} is outside the day")
+        if task.duration < 0:
+            raise ValueError(f"Task '{task.title}' has a negative duration")
+        self._max_dur = max(self._max_dur, task.duration)
+        i = bisect_left(self._starts_min, start_min)
+        if i < len(self._starts_min) and self._starts_min[i] == start_min:
+            self._durs_min[i] = task.duration
+            self._parallel[i] = task.can_be_parallel
+            self._tasks[i] = task
+            self._masks = None
+            self._overlaps = None
+            return
+        self._starts_min.insert(i, start_min)
+        self._durs_min.insert(i, task.duration)
+        self._parallel.insert(i, task.can_be_parallel)
+        self._tasks.insert(i, task)
+        self._overlaps = None
+        if self._masks is not None:
+            bits = ((1 << task.duration) - 1) << start_min
+            all_busy, solo_busy = self._masks
+            self._masks = (all_busy | bits,
+                           solo_busy if task.can_be_parallel else solo_busy | bits)
+
+    def busy_mask(self, parallel: bool = False) -> int:
+        """
+        Return the occupancy profile as a bitmask (bit m set = minute m is taken).
+
+        Args:
+            parallel: If True, only tasks that cannot run in parallel count as
+                occupying time, matching the overlap rule for parallel tasks.
+
+        Returns:
+            Integer bitmask of busy minutes
+        """
+        self._sync()
+        if self._masks is None:
+            all_busy = solo_busy = 0
+            for start, dur, task in zip(self._starts_min, self._durs_min, self._tasks):
+                bits = ((1 << dur) - 1) << start
+                all_busy |= bits
+                if not task.can_be_parallel:
+                    solo_busy |= bits
+            self._masks = (all_busy, solo_busy)
+        return self._masks[1] if parallel else self._masks[0]
+
+    def sorted_view(self) -> Iterator[Tuple[int, int, Task]]:
+        """Yield (start_min, end_min, task) in chronological order."""
+        self._sync()
+        for start, dur, task in zip(self._starts_min, self._durs_min, self._tasks):
+            yield start, start + dur, task
+
+    def overlapping(self, start_min: int, end_min: int) -> Iterator[Tuple[int, int, Task]]:
+        """
+        Yield (start_min, end_min, task) for entries overlapping [start_min, end_min).
+
+        Two binary searches bound the candidates: nothing starting at or after
+        end_min can overlap, and nothing starting more than the longest task
+        duration before start_min can still be running. Only that slice of
+        the start column is checked.
+        """
+        self._sync()
+        starts, durs = self._starts_min, self._durs_min
+        lo = bisect_right(starts, start_min - self._max_dur)
+        hi = bisect_left(starts, end_min)
+        for i in range(lo, hi):
+            start = starts[i]
+            end = start + durs[i]
+            if end > start_min:
+                yield start, end, self._tasks[i]
+
+    def overlaps(self) -> List[Tuple[int, int, Task, int, int, Task]]:
+        """
+        Return every pair of overlapping tasks, found with a sweep line.
+
+        The start column is already sorted, so overlap_pairs() compares each
+        task only with the tasks that start before it ends. This is O(n + k)
+        for k conflicts instead of comparing all n(n-1)/2 pairs. The result
+        is cached until the schedule changes, so the three conflict checks
+        (Scheduler.check_conflicts, Scheduler.get_conflict_warnings and
+        DailyPlan.get_warnings) share a single pass.
+
+        Returns:
+            List of (start1, end1, task1, start2, end2, task2) in minutes,
+            with task1 starting before task2.
+        """
+        self._sync()
+        if self._overlaps is None:
+            starts, durs, tasks = self._starts_min, self._durs_min, self._tasks
+            self._overlaps = [
+                (starts[i], starts[i] + durs[i], tasks[i], starts[j], starts[j] + durs[j], tasks[j])
+                for i, j in overlap_pairs(starts, durs)
+            ]
+        return self._overlaps
+
+    def has_overlap(self) -> bool:
+        """
+        Return True if any two tasks overlap.
+
+        One pass over the sorted starts comparing each with the previous end,
+        stopping at the first start that falls before it. Cheaper than
+        overlaps() when only a yes/no answer is needed (e.g. validation).
+        """
+        self._sync()
+        if self._overlaps is not None:
+            return bool(self._overlaps)
+        prev_end = -1
+        for start, dur in zip(self._starts_min, self._durs_min):
+            if start < prev_end:
+                return True
+            prev_end = start + dur  # No overlap so far, so this is the latest end
+        return False
+
+    def __getitem__(self, key: Union[str, int]) -> Task:
+        try:
+            i = self._index(self._to_min(key))
+        except ValueError:
+            raise KeyError(key) from None
+        if i < 0:
+            raise KeyError(key)
+        return self._tasks[i]
+
+    def __setitem__(self, key: Union[str, int], task: Task) -> None:
+        self.add(self._to_min(key), task)
+
+    def __delitem__(self, key: Union[str, int]) -> None:
+        try:
+            i = self._index(self._to_min(key))
+        except ValueError:
+            raise KeyError(key) from None
+        if i < 0:
+            raise KeyError(key)
+        del self._starts_min[i]
+        del self._durs_min[i]
+        del self._parallel[i]
+        del self._tasks[i]
+        self._masks = None
+        self._overlaps = None
+
+    def __iter__(self) -> Iterator[str]:
+        return (min_to_hhmm(m) for m in self._starts_min)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __repr__(self) -> str:
+        return f"Schedule({dict(self.items())!r})"
+
+
+def _scan_conflicts(schedule: Schedule) -> List[tuple]:
+    """
+    Classify every overlapping pair in a schedule for the conflict reports.
+
+    Shared by Scheduler.get_conflict_warnings, Scheduler.check_conflicts and
+    DailyPlan.get_warnings, which differ only in how they format the result.
+
+    Returns:
+        List of (start1, end1, task1, start2, end2, task2, pet1, pet2,
+        same_pet, overlap_min) tuples, with times in minutes and task1
+        starting first. Missing pet names are reported as "Unknown".
+    """
+    records = []
+    for s1, e1, task1, s2, e2, task2 in schedule.overlaps():
+        pet1 = task1.pet_name or "Unknown"
+        pet2 = task2.pet_name or "Unknown"
+        # Compare the interned lower-case names cached on each Task
+        same_pet = (task1._pet_key or "unknown") == (task2._pet_key or "unknown")
+        records.append((s1, e1, task1, s2, e2, task2, pet1, pet2,
+                        same_pet, min(e1, e2) - s2))
+    return records
+
+
+# Formatters for _scan_conflicts records, one per conflict report
+
+def _format_conflict_warning(rec: tuple) -> str:
+    """Format a conflict record for Scheduler.get_conflict_warnings."""
+    s1, _, task1, s2, _, task2, pet1, pet2, same_pet, overlap_min = rec
+    start1, start2 = min_to_hhmm(s1), min_to_hhmm(s2)
+    if same_pet:
+        return (f"⚠️  {pet1}: '{task1.title}' at {start1} conflicts with "
+                f"'{task2.title}' at {start2} ({overlap_min} min overlap)")
+    return (f"⚠️  Multi-pet conflict: {pet1}'s '{task1.title}' at {start1} "
+            f"overlaps with {pet2}'s '{task2.title}' at {start2} "
+            f"({overlap_min} min overlap)")
+
+
+def _format_conflict_detail(rec: tuple) -> str:
+    """Format a conflict record as a Scheduler.check_conflicts description."""
+    s1, e1, task1, s2, e2, task2, pet1, pet2, same_pet, overlap_min = rec
+    # Determine conflict type: same pet or different pets
+    if same_pet:
+        conflict_type = f"SAME PET ({pet1})"
+    else:
+        conflict_type = f"DIFFERENT PETS ({pet1} vs {pet2})"
+    return (f"[{conflict_type}] '{task1.title}' ({min_to_hhmm(s1)}-{min_to_hhmm(e1)}) "
+            f"overlaps with '{task2.title}' ({min_to_hhmm(s2)}-{min_to_hhmm(e2)}) "
+            f"by {overlap_min} min")
+
+
+def _format_plan_warning(rec: tuple) -> str:
+    """Format a conflict record for DailyPlan.get_warnings."""
+    _, _, task1, _, _, task2, pet1, pet2, same_pet, overlap = rec
+    if same_pet:
+        return f"⚠️  {pet1}: '{task1.title}' conflicts with '{task2.title}' ({overlap} min)"
+    return f"⚠️  {pet1} vs {pet2}: '{task1.title}' conflicts with '{task2.title}' ({overlap} min)"
+
+
+@dataclass(slots=True)
 class DailyPlan:
     """
     Represents the final output to show the user.
 
     Attributes:
         date: The specific date for this plan
-        schedule: A mapping of time slot to Task
+        schedule: A mapping of time slot to Task (a plain dict is converted
+            to a Schedule on construction)
         reasoning: Optional explanation of scheduling decisions
     """
     date: date
-    schedule: Dict[str, Task] = field(default_factory=dict)
+    schedule: Schedule = field(default_factory=Schedule)
     reasoning: str = ""
 
+    def __post_init__(self):
+        if not isinstance(self.schedule, Schedule):
+            self.schedule = Schedule(self.schedule)
+
     def get_warnings(self) -> List[str]:
         """
         Get conflict warnings directly from the plan without needing a Scheduler.
@@ -1187,8 +1824,7 @@ class DailyPlan:
             - Real-time validation as tasks are added
 
         Safety Features:
-            - Never raises exceptions
-            - Handles invalid data gracefully
+            - Never raises exceptions (entries are validated when added)
             - Returns empty list for empty schedules
 
         Returns:
@@ -1203,52 +1839,7 @@ class DailyPlan:
             ...     for w in warnings:
             ...         st.write(w)
         """
-        warnings = []
-
-        if not self.schedule:
-            return warnings
-
-        # Convert to time ranges
-        time_ranges = []
-        for start_str, task in self.schedule.items():
-            try:
-                start = parse_time(start_str)
-                end = add_minutes(start, task.duration)
-                time_ranges.append((start_str, time_to_str(end), task))
-            except (ValueError, AttributeError):
-                warnings.append(f"⚠️  Warning: Invalid time for '{task.title}'")
-                continue
-
-        # Check overlaps
-        for i in range(len(time_ranges)):
-            for j in range(i + 1, len(time_ranges)):
-                start1, end1, task1 = time_ranges[i]
-                start2, end2, task2 = time_ranges[j]
-
-                try:
-                    s1 = time_to_minutes(parse_time(start1))
-                    e1 = time_to_minutes(parse_time(end1))
-                    s2 = time_to_minutes(parse_time(start2))
-                    e2 = time_to_minutes(parse_time(end2))
-
-                    if not (e1 <= s2 or s1 >= e2):
-                        overlap = min(e1, e2) - max(s1, s2)
-                        pet1 = getattr(task1, 'pet_name', 'Unknown') or 'Unknown'
-                        pet2 = getattr(task2, 'pet_name', 'Unknown') or 'Unknown'
-
-                        if pet1.lower() == pet2.lower():
-                            warnings.append(
-                                f"⚠️  {pet1}: '{task1.title}' conflicts with '{task2.title}' ({overlap} min)"
-                            )
-                        else:
-                            warnings.append(
-                                f"⚠️  {pet1} vs {pet2}: '{task1.title}' conflicts with '{task2.title}' ({overlap} min)"
-                            )
-                except (ValueError, AttributeError, TypeError):
-                    warnings.append(f"⚠️  Could not validate '{task1.title}' vs '{task2.title}'")
-                    continue
-
-        return warnings
+        return [_format_plan_warning(rec) for rec in _scan_conflicts(self.schedule)]
 
     def format_for_display(self) -> str:
         """
@@ -1257,16 +1848,17 @@ class DailyPlan:
         Returns:
             Formatted string representation of the daily plan
         """
-        output = f"Daily Plan for {self.date}\n"
-        output += "=" * 40 + "\n\n"
+        parts = [f"Daily Plan for {self.date}\n", "=" * 40, "\n\n"]
 
         if not self.schedule:
-            output += "No tasks scheduled.\n"
+            parts.append("No tasks scheduled.\n")
         else:
-            for time_slot, task in sorted(self.schedule.items()):
-                output += f"{time_slot}: {task.title} ({task.duration} min)\n"
+            parts.extend(
+                f"{min_to_hhmm(start)}: {task.title} ({task.duration} min)\n"
+                for start, _, task in self.schedule.sorted_view()
+            )
 
         if self.reasoning:
-            output += f"\n{self.reasoning}"
+            parts.append(f"\n{self.reasoning}")
 
-        return output
+        return "".join(parts)
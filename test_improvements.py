@@ -170,7 +170,7 @@ def test_all_improvements():
 
     # Find first scheduled task
     if plan.schedule:
-        first_time = sorted(plan.schedule.keys())[0]
+        first_time = next(iter(plan.schedule))  # Schedule iterates in time order
         first_task = plan.schedule[first_time]
 
         print(f"\nOriginal: '{first_task.title}' at {first_time}")
@@ -10,7 +10,9 @@ import os
 # Add parent directory to path to import pawpal_system
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from pawpal_system import Task, Pet, Priority
+from datetime import date
+
+from pawpal_system import Task, Pet, Owner, Scheduler, Priority, DailyPlan, Schedule
 
 
 class TestSimple(unittest.TestCase):
@@ -80,6 +82,274 @@ class TestSimple(unittest.TestCase):
         self.assertIn(task1, pet.tasks, "First task should be in pet's task list")
         self.assertIn(task2, pet.tasks, "Second task should be in pet's task list")
 
+    def test_direct_assignment_updates_filters(self):
+        """
+        Cached Keys: Assigning priority or pet_name directly is seen by filters.
+        """
+        pet = Pet(name="Buddy", species="Dog")
+        task = Task(title="Walk", duration=30, priority=Priority.LOW, type="Exercise",
+                    pet_name="Buddy")
+        pet.add_task(task)
+
+        task.priority = Priority.HIGH
+        task.pet_name = "Rex"
+
+        self.assertEqual(pet.filter_tasks(by_priority=Priority.HIGH), [task])
+        scheduler = Scheduler(tasks=[task], owner_constraints=Owner(name="Sarah"))
+        self.assertEqual(scheduler.filter_tasks(pet_name="rex"), [task])
+
+        # Clearing the names is allowed and simply stops them matching
+        task.pet_name = None
+        task.type = None
+        self.assertEqual(scheduler.filter_tasks(pet_name="rex"), [])
+        self.assertEqual(pet.filter_tasks(by_type="Exercise"), [])
+
+
+class TestRecurrence(unittest.TestCase):
+    """Tests for recurring task handling."""
+
+    def test_weekly_task_recurs_after_seven_days(self):
+        """
+        Recurrence: Completing a weekly task yields the next occurrence a week
+        later, and the scheduler only treats it as due on matching weekdays.
+        """
+        start = date(2026, 3, 2)
+        bath = Task(title="Bath", duration=30, priority=Priority.LOW, type="Grooming",
+                    frequency="Weekly", due_date=start)
+        scheduler = Scheduler(tasks=[bath], owner_constraints=Owner(name="Sarah"))
+
+        next_bath = bath.mark_complete()
+        self.assertEqual(next_bath.due_date, date(2026, 3, 9))
+        self.assertTrue(scheduler._is_due_today(bath, date(2026, 3, 16)))
+        self.assertFalse(scheduler._is_due_today(bath, date(2026, 3, 10)))
+
+    def test_frequency_assigned_after_creation_recurs(self):
+        """
+        Recurrence: Setting frequency on an existing task makes it recur.
+        """
+        start = date(2026, 3, 2)
+        feed = Task(title="Feed", duration=10, priority=Priority.HIGH, type="Feeding",
+                    due_date=start)
+        self.assertIsNone(feed.mark_complete())
+
+        feed.frequency = "daily"
+        next_feed = feed.mark_complete()
+        self.assertEqual(next_feed.due_date, date(2026, 3, 3))
+
+
+class TestOwner(unittest.TestCase):
+    """Tests for owner availability."""
+
+    def test_batch_availability_matches_individual_calls(self):
+        """Adding blocks in one batch gives the same slots and total as one at a time."""
+        one_by_one = Owner(name="Jordan")
+        one_by_one.set_availability("17:00", "19:00")
+        one_by_one.set_availability("08:00", "09:00")
+
+        batched = Owner(name="Jordan")
+        batched.set_availability_batch([("17:00", "19:00"), ("08:00", "09:00")])
+
+        self.assertEqual(batched.available_hours, (("08:00", "09:00"), ("17:00", "19:00")))
+        self.assertEqual(batched.available_hours, one_by_one.available_hours)
+        self.assertEqual(batched.total_available_minutes(), 180)
+        self.assertTrue(batched.is_available("18:30"))
+
+    def test_task_longer_than_every_block_is_skipped(self):
+        """A task that no single availability block can hold is skipped up front."""
+        owner = Owner(name="Jordan")
+        owner.set_availability_batch([("08:00", "08:30"), ("09:00", "09:30")])
+        self.assertTrue(owner.has_window_for(30))
+        self.assertFalse(owner.has_window_for(45))
+
+        long_walk = Task(title="Long walk", duration=45, priority=Priority.HIGH, type="Exercise")
+        feed = Task(title="Feed", duration=30, priority=Priority.LOW, type="Feeding")
+        plan = Scheduler(tasks=[long_walk, feed], owner_constraints=owner).generate_daily_plan()
+
+        self.assertEqual(list(plan.schedule.values()), [feed])
+        self.assertIn("Long walk", plan.reasoning)
+
+    def test_available_hours_constructor_argument(self):
+        """Availability passed positionally is applied, and the views are read-only."""
+        owner = Owner("Jordan", [("08:00", "09:00")])
+
+        self.assertIsNone(owner.energy_level)
+        self.assertEqual(owner.total_available_minutes(), 60)
+        self.assertEqual(owner.available_minutes, ((480, 540),))
+        with self.assertRaises(AttributeError):
+            owner.available_hours.append(("17:00", "18:00"))
+        with self.assertRaises(AttributeError):
+            owner.available_minutes.append((1020, 1080))
+        self.assertIn("available_hours=(('08:00', '09:00'),)", repr(owner))
+
+
+class TestSchedule(unittest.TestCase):
+    """Tests for the array-backed DailyPlan schedule."""
+
+    def test_schedule_keeps_chronological_order(self):
+        """
+        Schedule: Entries added out of order come back sorted by start time,
+        whether keyed by "HH:MM" strings or int minutes.
+        """
+        walk = Task(title="Walk", duration=30, priority=Priority.HIGH, type="Exercise")
+        feed = Task(title="Feed", duration=10, priority=Priority.MEDIUM, type="Feeding")
+        plan = DailyPlan(date=date.today(), schedule={"9:15": walk})
+        plan.schedule.add(8 * 60, feed)
+
+        self.assertIsInstance(plan.schedule, Schedule)
+        self.assertEqual(list(plan.schedule), ["08:00", "09:15"])
+        self.assertIs(plan.schedule["09:15"], walk)
+        self.assertEqual(list(plan.schedule.sorted_view()), [(480, 490, feed), (555, 585, walk)])
+
+        del plan.schedule["08:00"]
+        self.assertNotIn("08:00", plan.schedule)
+        self.assertEqual(len(plan.schedule), 1)
+
+        # Bad start times are rejected on insert, before any scan sees them
+        with self.assertRaises(ValueError):
+            plan.schedule.add(-30, feed)
+
+
+class TestConflicts(unittest.TestCase):
+    """Tests for schedule conflict detection."""
+
+    def test_check_conflicts_finds_nested_overlaps(self):
+        """
+        Conflict Detection: A long task overlapping two later tasks reports both
+        pairs, while back-to-back tasks are not conflicts.
+        """
+        bath = Task(title="Bath", duration=60, priority=Priority.HIGH, type="Grooming", pet_name="Buddy")
+        walk = Task(title="Walk", duration=10, priority=Priority.HIGH, type="Exercise", pet_name="Buddy")
+        feed = Task(title="Feed", duration=10, priority=Priority.MEDIUM, type="Feeding", pet_name="Buddy")
+        brush = Task(title="Brush", duration=10, priority=Priority.LOW, type="Grooming", pet_name="Buddy")
+        plan = DailyPlan(date=date.today(), schedule={
+            "08:00": bath, "08:10": walk, "08:40": feed, "09:00": brush,
+        })
+        scheduler = Scheduler(tasks=[], owner_constraints=Owner(name="Sarah"))
+
+        pairs = [(t1, t2) for t1, t2, _ in scheduler.check_conflicts(plan)]
+        self.assertEqual(pairs, [("Bath", "Walk"), ("Bath", "Feed")])
+        self.assertEqual(len(scheduler.get_conflict_warnings(plan)), 2)
+        self.assertEqual(len(plan.get_warnings()), 2)
+        self.assertTrue(plan.schedule.has_overlap())
+
+        # The shared conflict scan is refreshed after the schedule changes
+        del plan.schedule["08:10"]
+        self.assertEqual(len(scheduler.check_conflicts(plan)), 1)
+        self.assertEqual(len(plan.get_warnings()), 1)
+
+        del plan.schedule["08:00"]
+        self.assertFalse(plan.schedule.has_overlap())
+
+    def test_conflicts_follow_task_edits_after_scheduling(self):
+        """
+        Conflict Detection: Lengthening a scheduled task, or clearing its
+        parallel flag, is seen by the next conflict check.
+        """
+        a = Task(title="a", duration=10, priority=Priority.HIGH, type="Exercise")
+        b = Task(title="b", duration=10, priority=Priority.HIGH, type="Feeding",
+                 can_be_parallel=True)
+        plan = DailyPlan(date=date.today(), schedule={"08:00": a, "08:30": b})
+        scheduler = Scheduler(tasks=[], owner_constraints=Owner(name="Sarah"))
+        self.assertEqual(plan.get_warnings(), [])
+
+        a.update_details(duration=60)
+        self.assertEqual(len(plan.get_warnings()), 1)
+        self.assertEqual([(t1, t2) for t1, t2, _ in scheduler.check_conflicts(plan)], [("a", "b")])
+
+        a.can_be_parallel = True
+        self.assertEqual(plan.schedule.busy_mask(parallel=True), 0)
+
+
+class TestScheduling(unittest.TestCase):
+    """Tests for daily plan generation."""
+
+    def test_overlapping_exact_times_pick_best_set(self):
+        """
+        Pinned Times: Two tasks that together outweigh one overlapping task of
+        the same priority keep their requested times; the single task moves.
+        """
+        owner = Owner(name="Sarah")
+        owner.set_availability("07:00", "10:00")
+        vet = Task(title="Vet Call", duration=50, priority=Priority.MEDIUM, type="Health",
+                   preferred_time="07:15")
+        breakfast = Task(title="Breakfast", duration=30, priority=Priority.MEDIUM, type="Feeding",
+                         preferred_time="07:00")
+        walk = Task(title="Walk", duration=30, priority=Priority.MEDIUM, type="Exercise",
+                    preferred_time="08:00")
+
+        plan = Scheduler(tasks=[vet, breakfast, walk], owner_constraints=owner).generate_daily_plan()
+
+        self.assertIs(plan.schedule["07:00"], breakfast)
+        self.assertIs(plan.schedule["08:00"], walk)
+        self.assertIn(vet, plan.schedule.values())
+        self.assertNotIn("07:15", plan.schedule)
+
+    def test_pinned_task_does_not_displace_higher_priority_task(self):
+        """
+        Pinned Times: A low-priority exact-time request gives way to a
+        high-priority flexible task that needs the same slot.
+        """
+        owner = Owner(name="Sarah")
+        owner.set_availability("08:00", "08:30")
+        medication = Task(title="Medication", duration=30, priority=Priority.HIGH, type="Health")
+        play = Task(title="Play", duration=30, priority=Priority.LOW, type="Fun",
+                    preferred_time="08:00")
+
+        plan = Scheduler(tasks=[play, medication], owner_constraints=owner).generate_daily_plan()
+
+        self.assertIs(plan.schedule["08:00"], medication)
+        self.assertNotIn(play, plan.schedule.values())
+
+    def test_plan_sees_tasks_swapped_on_shared_pet_list(self):
+        """
+        Shared Task List: Removing one task and adding another through the Pet
+        between plans is reflected in the next plan.
+        """
+        pet = Pet(name="Buddy", species="Dog")
+        walk = Task(title="Walk", duration=30, priority=Priority.HIGH, type="Exercise")
+        groom = Task(title="Groom", duration=30, priority=Priority.HIGH, type="Grooming")
+        pet.add_task(walk)
+        owner = Owner(name="Sarah")
+        owner.set_availability("08:00", "10:00")
+        scheduler = Scheduler(tasks=pet.tasks, owner_constraints=owner)
+        scheduler.generate_daily_plan()
+
+        pet.remove_task(walk)
+        pet.add_task(groom)
+        plan = scheduler.generate_daily_plan()
+
+        self.assertEqual(list(plan.schedule.values()), [groom])
+
+    def test_high_energy_task_starts_when_morning_window_opens(self):
+        """
+        Energy Matching: A high-energy task in a block that opens before 06:00
+        starts at 06:00 instead of being skipped.
+        """
+        owner = Owner(name="Sarah")
+        owner.set_availability("05:00", "07:00")
+        run = Task(title="Run", duration=30, priority=Priority.HIGH, type="Exercise",
+                   energy_required="high")
+
+        plan = Scheduler(tasks=[run], owner_constraints=owner).generate_daily_plan()
+
+        self.assertIs(plan.schedule["06:00"], run)
+
+    def test_reschedule_moves_task_after_cutoff(self):
+        """
+        Rescheduling: A missed task moves to the first slot after the cutoff
+        without changing the owner's availability.
+        """
+        owner = Owner(name="Sarah")
+        owner.set_availability("07:00", "09:00")
+        owner.set_availability("17:00", "19:00")
+        walk = Task(title="Walk", duration=30, priority=Priority.HIGH, type="Exercise")
+        scheduler = Scheduler(tasks=[walk], owner_constraints=owner)
+        plan = scheduler.generate_daily_plan()
+
+        self.assertEqual(scheduler.reschedule_task(plan, "Walk", from_time="08:45"), "17:00")
+        self.assertEqual(list(plan.schedule), ["17:00"])
+        self.assertEqual(owner.available_hours, (("07:00", "09:00"), ("17:00", "19:00")))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,76 +1,169 @@
 """
 Quick verification script to ensure app.py can import from pawpal_system.py
 and that objects can be created successfully.
+
+Run with --importtime to also list the slowest module imports, or with
+--quiet to skip the per-step details.
 """
 
-print("Testing imports from pawpal_system...")
+import sys
+from types import SimpleNamespace
+
+_SEP = "=" * 50
 
-try:
-    from pawpal_system import Task, Pet, Owner, Scheduler, DailyPlan, Priority
-    print("✓ All imports successful!")
-except ImportError as e:
-    print(f"✗ Import failed: {e}")
-    exit(1)
+# (title, duration, priority name, type) for the sample tasks; priorities are
+# given by name because pawpal_system is only imported once main() runs
+TASK_SPECS = (
+    ("Morning walk", 30, "HIGH", "Exercise"),
+    ("Feed breakfast", 15, "MEDIUM", "Feeding"),
+)
 
-print("\nTesting object creation...")
+# (name, indexes into TASK_SPECS) for each plan the scheduler step generates
+SCENARIOS = (
+    ("All tasks", (0, 1)),
+    ("Walk only", (0,)),
+    ("Feeding only", (1,)),
+)
 
-# Test Pet creation
-try:
-    pet = Pet(
+
+def create_pet(api, built):
+    pet = api.Pet(
         name="Mochi",
         species="Dog",
         breed="Shiba Inu",
         notes="Very energetic"
     )
-    print(f"✓ Pet created: {pet.get_profile()}")
-except Exception as e:
-    print(f"✗ Pet creation failed: {e}")
-    exit(1)
-
-# Test Owner creation
-try:
-    owner = Owner(name="Jordan", pet=pet)
-    owner.set_availability("08:00", "09:00")
-    owner.set_availability("17:00", "19:00")
-    print(f"✓ Owner created: {owner.name}")
-    print(f"  Available time: {owner.total_available_minutes()} minutes")
-except Exception as e:
-    print(f"✗ Owner creation failed: {e}")
-    exit(1)
-
-# Test Task creation
-try:
-    task1 = Task(
-        title="Morning walk",
-        duration=30,
-        priority=Priority.HIGH,
-        type="Exercise"
-    )
-    task2 = Task(
-        title="Feed breakfast",
-        duration=15,
-        priority=Priority.MEDIUM,
-        type="Feeding"
-    )
-    print(f"✓ Tasks created: {task1}, {task2}")
-except Exception as e:
-    print(f"✗ Task creation failed: {e}")
-    exit(1)
-
-# Test Scheduler
-try:
-    scheduler = Scheduler(
-        tasks=[task1, task2],
-        owner_constraints=owner
+    built["pet"] = pet
+    return lambda: [f"✓ Pet created: {pet.get_profile()}"]
+
+
+def create_owner(api, built):
+    owner = api.Owner(name="Jordan", pet=built["pet"])
+    owner.set_availability_batch([("08:00", "09:00"), ("17:00", "19:00")])
+    built["owner"] = owner
+    return lambda: [f"✓ Owner created: {owner.name}",
+                    f"  Available time: {owner.total_available_minutes()} minutes"]
+
+
+def create_tasks(api, built):
+    tasks = [
+        api.Task(title=title, duration=duration, priority=api.Priority[priority],
+                 type=task_type)
+        for title, duration, priority, task_type in TASK_SPECS
+    ]
+    built["tasks"] = tasks
+    return lambda: [f"✓ Tasks created: {', '.join(map(str, tasks))}"]
+
+
+def run_scheduler(api, built):
+    # The pet, owner and tasks are built once by the earlier steps and shared
+    # by every scenario; only the task selection changes between plans
+    tasks, owner = built["tasks"], built["owner"]
+    counts = []
+    for name, picks in SCENARIOS:
+        scheduler = api.Scheduler(
+            tasks=[tasks[i] for i in picks],
+            owner_constraints=owner
+        )
+        plan = scheduler.generate_daily_plan()
+        counts.append((name, len(plan.schedule), len(picks)))
+    return lambda: [
+        f"✓ Scheduler works! Generated plans for {len(SCENARIOS)} scenarios",
+        *(f"  {name}: {done} of {total} tasks scheduled" for name, done, total in counts),
+    ]
+
+
+# (label used in the failure message, step) pairs, run in order. Each step is
+# called as step(api, built): `api` holds the pawpal_system names imported by
+# main() and `built` the objects made by earlier steps. It returns a callable
+# that formats its detail lines, so --quiet skips that work.
+STEPS = (
+    ("Pet creation", create_pet),
+    ("Owner creation", create_owner),
+    ("Task creation", create_tasks),
+    ("Scheduler", run_scheduler),
+)
+
+
+def profile_imports(args):
+    """
+    Re-run this script under ``-X importtime`` and list the slowest imports.
+
+    The child's own output is passed through unchanged, followed by the ten
+    modules with the highest self import time.
+
+    Args:
+        args: Command-line arguments to pass on to the child run
+
+    Returns:
+        The child's exit code
+    """
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, *args],
+        capture_output=True, text=True
     )
-    plan = scheduler.generate_daily_plan()
-    print(f"✓ Scheduler works! Generated plan with {len(plan.schedule)} tasks")
-except Exception as e:
-    print(f"✗ Scheduler failed: {e}")
-    exit(1)
-
-print("\n" + "="*50)
-print("✓ ALL VERIFICATIONS PASSED!")
-print("="*50)
-print("\nYour app.py should work correctly.")
-print("Run it with: streamlit run app.py")
+    sys.stdout.write(result.stdout)
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        if self_us.strip().isdigit():
+            timings.append((int(self_us), int(cumulative_us), module.strip()))
+    timings.sort(reverse=True)
+
+    print(f"\nSlowest imports ({len(timings)} modules loaded):")
+    print(f"{'self [us]':>10} {'cumul [us]':>11}  module")
+    for self_us, cumulative_us, module in timings[:10]:
+        print(f"{self_us:>10} {cumulative_us:>11}  {module}")
+    return result.returncode
+
+
+def main():
+    if "--importtime" in sys.argv[1:]:
+        sys.exit(profile_imports([a for a in sys.argv[1:] if a != "--importtime"]))
+    quiet = "--quiet" in sys.argv[1:]
+
+    # The banner goes out straight away so it shows while pawpal_system loads;
+    # everything after it is collected and written to stdout in one call
+    print("Testing imports from pawpal_system...", flush=True)
+    out = []
+    log = out.append
+
+    def fail(message):
+        log(message)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.exit(1)
+
+    # Imported here rather than at module level so the banner prints first
+    try:
+        from pawpal_system import Task, Pet, Owner, Scheduler, Priority
+        api = SimpleNamespace(Task=Task, Pet=Pet, Owner=Owner, Scheduler=Scheduler,
+                              Priority=Priority)
+        log("✓ All imports successful!")
+    except ImportError as e:
+        fail(f"✗ Import failed: {e}")
+
+    log("\nTesting object creation...")
+
+    built = {}
+    for label, step in STEPS:
+        try:
+            details = step(api, built)
+        except Exception as e:
+            fail(f"✗ {label} failed: {e}")
+        if not quiet:
+            out.extend(details())
+
+    log(f"\n{_SEP}\n✓ ALL VERIFICATIONS PASSED!\n{_SEP}")
+    log("\nYour app.py should work correctly.")
+    log("Run it with: streamlit run app.py")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()